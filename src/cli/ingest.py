@@ -16,8 +16,8 @@ from pathlib import Path
 
 from src.ingestion.chroma_client import ChromaDBClient
 from src.ingestion.pipeline import discover_datasheets, ingest_batch
-from src.models import BatchIngestionReport
-from src.utils.logger import setup_logging
+from src.models import BatchIngestionReport, IngestionResult
+from src.utils.logger import flush_logging, setup_logging
 from src.utils.validators import validate_folder_path
 
 logger = logging.getLogger("datasheet_ingestion.cli")
@@ -38,6 +38,8 @@ ENV_CHROMADB_COLLECTION = "CHROMADB_COLLECTION"
 DEFAULT_CHROMADB_PATH = Path(r"D:\.cache\chromadb")
 DEFAULT_COLLECTION_NAME = "datasheets"
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_INSERT_CONCURRENCY = 1
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -72,6 +74,9 @@ Examples:
   # Set custom log level
   python main.py D:\\datasheets\\components --log-level DEBUG
 
+  # Ingest 4 datasheets in parallel
+  python main.py D:\\datasheets\\components --max-workers 4
+
 Environment Variables:
   CHROMADB_PATH          Path to ChromaDB storage (default: D:\\.cache\\chromadb)
   CHROMADB_COLLECTION    Collection name (default: datasheets)
@@ -120,6 +125,23 @@ Exit Codes:
         help="Chunk overlap in tokens (default: 100 tokens)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of datasheets ingested in parallel (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--insert-concurrency",
+        type=int,
+        default=DEFAULT_INSERT_CONCURRENCY,
+        help=(
+            "Insert batches of one large datasheet sent in parallel; mind the "
+            f"embedding API rate limit (default: {DEFAULT_INSERT_CONCURRENCY})"
+        ),
+    )
+
     parser.add_argument(
         "--in-mem-chroma",
         action="store_true",
@@ -180,8 +202,13 @@ def print_banner(
   Log Level:          {args.log_level}
   Chunk Size:         {chunk_size_str}
   Chunk Overlap:      {chunk_overlap_str}
+  Max Workers:        {args.max_workers}
+  Insert Concurrency: {args.insert_concurrency}
 {"=" * 70}
 """
+    # Log records are written on a background thread; let the ones logged so
+    # far reach the console first so they don't interleave with the banner
+    flush_logging()
     print(banner)
 
 
@@ -198,6 +225,28 @@ def print_progress(current: int, total: int, datasheet_name: str, status: str) -
     logger.info(f"[{current}/{total}] {datasheet_name}: {status}")
 
 
+def report_progress(current: int, total: int, result: IngestionResult) -> None:
+    """
+    Progress callback for ingest_batch() that prints per-datasheet outcome.
+
+    Args:
+        current: Number of datasheets completed so far (1-indexed)
+        total: Total number of datasheets
+        result: Ingestion result of the completed datasheet
+    """
+    if result.is_success():
+        status = (
+            f"[OK] Success: {result.chunks_created} chunks, "
+            f"{result.tokens_inserted} tokens, {result.duration_seconds:.2f}s"
+        )
+    elif result.is_skipped():
+        status = f"[>>] Skipped: {result.skipped_reason}"
+    else:
+        status = f"[X] Failed: {result.error_message}"
+
+    print_progress(current, total, result.datasheet_name, status)
+
+
 def print_summary(report) -> None:
     """
     Print batch ingestion summary report.
@@ -231,7 +280,7 @@ def ingest(
         persist_db: Whether to persist ChromaDB to disk (False for ephemeral)
         force_update: If True, delete existing chunks before re-ingestion
         **ingestion_params: Additional parameters passed to ingest_batch()
-                          (e.g., chunk_size, chunk_overlap)
+                          (e.g., chunk_size, chunk_overlap, progress_callback)
 
     Returns:
         Tuple of (BatchIngestionReport, ChromaDBClient)
@@ -278,6 +327,7 @@ def ingest(
 
     # Run batch ingestion
     logger.info("Starting batch ingestion...")
+    ingestion_params.setdefault("progress_callback", report_progress)
     report = ingest_batch(
         datasheets,
         chroma_client,
@@ -321,6 +371,8 @@ def main() -> int:
             force_update=args.force_update,
             chunk_size=args.chunk_size,
             chunk_overlap=args.chunk_overlap,
+            max_workers=args.max_workers,
+            insert_concurrency=args.insert_concurrency,
         )
 
         # Print summary
@@ -9,6 +9,7 @@ Provides high-level interface for:
 """
 
 import logging
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +26,25 @@ from src.models import ContentChunk
 logger = logging.getLogger("datasheet_ingestion.chroma_client")
 
 
+@cache
+def _get_embedding_function(model_name: str) -> OpenAIEmbeddingFunction:
+    """
+    Get the shared OpenAI embedding function for a model.
+
+    The embedding function owns the OpenAI HTTP client, so sharing one
+    instance keeps its connection pool warm across every ChromaDBClient
+    created in the process (e.g. one per evaluation experiment) instead of
+    paying a fresh TLS handshake each time.
+
+    Args:
+        model_name: OpenAI embedding model name
+
+    Returns:
+        Cached embedding function instance
+    """
+    return OpenAIEmbeddingFunction(model_name=model_name)
+
+
 class ChromaDBClient:
     """
     Wrapper for ChromaDB operations in datasheet ingestion pipeline.
@@ -88,7 +108,7 @@ class ChromaDBClient:
             RuntimeError: If collection initialization fails
         """
         hnsw_config = CreateHNSWConfiguration(space="cosine")
-        ef = OpenAIEmbeddingFunction(model_name="text-embedding-3-small")
+        ef = _get_embedding_function("text-embedding-3-small")
         config = CreateCollectionConfiguration(hnsw=hnsw_config, embedding_function=ef)
         try:
             collection = self.client.get_or_create_collection(
@@ -120,23 +140,36 @@ class ChromaDBClient:
                 f"Failed to initialize collection '{self.collection_name}': {e}"
             ) from e
 
-    def insert_chunks(self, chunks: list[ContentChunk]) -> int:
+    def insert_chunks(
+        self,
+        chunks: list[ContentChunk],
+        embeddings: list[list[float]] | None = None,
+    ) -> int:
         """
         Insert content chunks into ChromaDB with embeddings.
 
         Args:
             chunks: List of content chunks to insert
+            embeddings: Precomputed embedding of each chunk, parallel to chunks
+                (default: the collection's embedding function embeds all
+                chunk texts in one batched call)
 
         Returns:
             Number of chunks successfully inserted
 
         Raises:
+            ValueError: If embeddings don't match chunks one-to-one
             RuntimeError: If insertion fails
         """
         if not chunks:
             logger.warning("No chunks to insert")
             return 0
 
+        if embeddings is not None and len(embeddings) != len(chunks):
+            raise ValueError(
+                f"Got {len(embeddings)} embeddings for {len(chunks)} chunks"
+            )
+
         try:
             # Convert chunks to ChromaDB format
             documents = []
@@ -152,9 +185,10 @@ class ChromaDBClient:
                 chunk_id = f"{chunk.datasheet_name}_{chunk.chunk_index}"
                 ids.append(chunk_id)
 
-            # Insert into ChromaDB (embeddings auto-generated)
+            # Insert into ChromaDB (embeddings auto-generated unless provided)
             self.collection.add(
                 documents=documents,
+                embeddings=embeddings,
                 metadatas=metadatas,
                 ids=ids,
             )
@@ -176,9 +210,11 @@ class ChromaDBClient:
             True if datasheet exists, False otherwise
         """
         try:
+            # Only ids are needed; skip fetching documents and metadata
             results = self.collection.get(
                 where={"datasheet_name": datasheet_name},
                 limit=1,
+                include=[],
             )
 
             exists = len(results["ids"]) > 0
@@ -190,6 +226,41 @@ class ChromaDBClient:
             logger.error(f"Error checking datasheet existence: {e}")
             return False
 
+    def get_datasheet_fingerprint(self, datasheet_name: str) -> tuple[bool, str | None]:
+        """
+        Check if datasheet exists and return its stored source fingerprint.
+
+        Fetches the metadata of a single chunk only, so this costs one query
+        like datasheet_exists() while also enabling change detection.
+
+        Args:
+            datasheet_name: Name of datasheet to check
+
+        Returns:
+            Tuple of (exists, source_fingerprint)
+            - exists: True if any chunk of the datasheet is stored
+            - source_fingerprint: Fingerprint recorded at ingestion, or None
+              if absent (e.g. chunks ingested before fingerprints existed)
+        """
+        try:
+            results = self.collection.get(
+                where={"datasheet_name": datasheet_name},
+                limit=1,
+                include=["metadatas"],
+            )
+
+            if not results["ids"]:
+                return False, None
+
+            metadatas = results.get("metadatas") or [{}]
+            fingerprint = (metadatas[0] or {}).get("source_fingerprint")
+            logger.debug(f"Datasheet '{datasheet_name}' already exists in ChromaDB")
+            return True, fingerprint
+
+        except Exception as e:
+            logger.error(f"Error checking datasheet existence: {e}")
+            return False, None
+
     def delete_datasheet(self, datasheet_name: str) -> int:
         """
         Delete all chunks for a specific datasheet.
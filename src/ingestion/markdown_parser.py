@@ -13,6 +13,9 @@ from pathlib import Path
 
 logger = logging.getLogger("datasheet_ingestion.markdown_parser")
 
+# Markdown image: ![alt](path) or ![alt](path "title"); group 1 is the path
+_IMAGE_REF_RE = re.compile(r'!\[[^\]]*\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+
 
 def parse_markdown_file(markdown_path: Path) -> str:
     """
@@ -147,16 +150,10 @@ def extract_image_references(content: str) -> list[str]:
         >>> extract_image_references("Text ![photo](img.png) more")
         ['img.png']
     """
-    # Regex pattern for markdown images: ![alt](path) or ![alt](path "title")
-    pattern = r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"[^"]*")?\)'
-
-    matches = re.findall(pattern, content)
-
-    # Extract just the path component (second group)
-    image_refs = [match[1] for match in matches]
+    image_refs = _IMAGE_REF_RE.findall(content)
 
     if image_refs:
-        logger.debug(f"Extracted {len(image_refs)} image references from markdown")
+        logger.debug("Extracted %d image references from markdown", len(image_refs))
 
     return image_refs
 
@@ -195,23 +192,16 @@ def resolve_all_image_paths(
         logger.debug("No image references found in markdown")
         return content, []
 
-    resolved_paths = []
-    updated_content = content
-
-    # Resolve each image reference
+    # Resolve each distinct reference once
+    resolved_by_ref: dict[str, Path | None] = {}
     for image_ref in image_refs:
+        if image_ref in resolved_by_ref:
+            continue
+
         resolved_path = resolve_image_path(image_ref, markdown_path)
+        resolved_by_ref[image_ref] = resolved_path
 
         if resolved_path:
-            resolved_paths.append(resolved_path)
-
-            # Replace relative path with absolute path in content
-            # Use regex to ensure we only replace within image syntax
-            pattern = rf"(!\[[^\]]*\]\(){re.escape(image_ref)}(\))"
-            # Convert Path to string and escape backslashes for regex replacement
-            replacement = rf"\1{str(resolved_path).replace(chr(92), chr(92)*2)}\2"
-            updated_content = re.sub(pattern, replacement, updated_content)
-
             logger.debug(f"Replaced '{image_ref}' with '{resolved_path}'")
         else:
             logger.warning(
@@ -219,6 +209,25 @@ def resolve_all_image_paths(
                 f"keeping original reference"
             )
 
+    resolved_paths = [
+        resolved_by_ref[image_ref]
+        for image_ref in image_refs
+        if resolved_by_ref[image_ref]
+    ]
+
+    def _replace_image_path(match: re.Match[str]) -> str:
+        resolved_path = resolved_by_ref.get(match.group(1))
+        if resolved_path is None:
+            return match.group(0)
+        # Swap only the path span, keeping alt text and title as written
+        ref_start = match.start(1) - match.start()
+        ref_end = match.end(1) - match.start()
+        reference = match.group(0)
+        return f"{reference[:ref_start]}{resolved_path}{reference[ref_end:]}"
+
+    # Rewrite every image reference in a single pass over the content
+    updated_content = _IMAGE_REF_RE.sub(_replace_image_path, content)
+
     logger.info(
         f"Resolved {len(resolved_paths)}/{len(image_refs)} image paths successfully"
     )
@@ -5,12 +5,19 @@ Coordinates:
     - Datasheet discovery (folder scanning)
     - Single datasheet ingestion (parse → chunk → embed → store)
     - Batch ingestion with error handling and progress logging
+    - Concurrent batch ingestion via asyncio
     - Performance tracking
 """
 
+import asyncio
 import logging
+import os
 import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from src.ingestion.chroma_client import ChromaDBClient
@@ -34,53 +41,125 @@ logger = logging.getLogger("datasheet_ingestion.pipeline")
 # Performance target: 30 seconds per datasheet
 PERFORMANCE_TARGET_SECONDS = 30.0
 EMBEDDING_MODEL_TOKEN_LIMIT = 100000
+# Default number of insert batches of one datasheet in flight at once. Each
+# batch can carry up to EMBEDDING_MODEL_TOKEN_LIMIT tokens and ingest_batch
+# may run several datasheets in parallel, so raise insert_concurrency only
+# when the embedding API's tokens-per-minute limit allows it
+DEFAULT_INSERT_CONCURRENCY = 1
+MAX_INSERT_BATCH_SIZE = 500  # Chunks per insert request
+PARSE_CACHE_SIZE = 64  # Parsed markdown files kept in memory
+DISCOVERY_MAX_WORKERS = 16  # Datasheet subfolders scanned at once
+
+# Progress callback signature: (completed_count, total_count, result)
+ProgressCallback = Callable[[int, int, IngestionResult], None]
+
+# Default number of datasheets in flight for ingest_batch_async
+DEFAULT_INGEST_CONCURRENCY = 4
+
+
+@dataclass(frozen=True, slots=True)
+class ImageIndex:
+    """
+    Lookup table matching chunk image references to resolved image paths.
+
+    Built once per datasheet by build_image_index and reused for every chunk.
+
+    Attributes:
+        paths: Normalized image filename or absolute path -> absolute path string
+    """
+
+    paths: dict[str, str]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def get(self, ref: str) -> str | None:
+        """
+        Look up an image reference by normalized full path, then by filename.
+
+        Args:
+            ref: Image reference from markdown (relative or absolute)
+
+        Returns:
+            Absolute path string of the matching image, or None
+        """
+        ref = os.path.normcase(ref)
+        resolved = self.paths.get(ref)
+        if resolved is None:
+            resolved = self.paths.get(os.path.basename(ref))
+        return resolved
+
+
+def build_image_index(all_resolved_images: Sequence[Path | str]) -> ImageIndex:
+    """
+    Build an image index for matching chunk image references to resolved paths.
+
+    Each image is keyed by its filename (for relative references) and by its
+    absolute path string (for absolute references). Keys are normalized with
+    os.path.normcase, so on Windows case and slash direction don't matter.
+
+    Args:
+        all_resolved_images: All resolved image paths for the datasheet, as
+            Path objects or path strings
+
+    Returns:
+        ImageIndex over the given images
+    """
+    paths = {}
+    for path in all_resolved_images:
+        path_str = os.fspath(path)
+        paths[os.path.normcase(os.path.basename(path_str))] = path_str
+        paths[os.path.normcase(path_str)] = path_str
+    return ImageIndex(paths)
 
 
 def _filter_chunk_image_paths(
     chunk_text: str,
-    all_resolved_images: list[Path],
+    all_resolved_images: Sequence[Path | str] | ImageIndex,
 ) -> list[str]:
     """
     Filter resolved image paths to only those referenced in chunk text.
 
     Args:
         chunk_text: Text content of the chunk
-        all_resolved_images: All resolved image paths for the datasheet
+        all_resolved_images: All resolved image paths (Path objects or
+            strings) for the datasheet, or their prebuilt build_image_index();
+            pass the index when filtering many chunks of the same datasheet
 
     Returns:
         List of absolute path strings for images referenced in this chunk
     """
+    # Cheap substring checks first: most chunks contain no image syntax, and
+    # nothing can match when no images were resolved for the datasheet
+    if not all_resolved_images or "![" not in chunk_text:
+        return []
+
     # Extract image references from chunk text
     image_refs = extract_image_references(chunk_text)
 
     if not image_refs:
         return []
 
-    # Create mapping of image filename to resolved path
-    # (handles both relative refs like "image.png" and absolute paths)
-    filename_to_path = {path.name: path for path in all_resolved_images}
-
-    # Also map full resolved path strings for absolute references
-    pathstr_to_path = {str(path): path for path in all_resolved_images}
+    if isinstance(all_resolved_images, ImageIndex):
+        image_index = all_resolved_images
+    else:
+        image_index = build_image_index(all_resolved_images)
 
     chunk_images = []
+    seen = set()
     for ref in image_refs:
-        # Try to match by filename first (most common case for relative refs)
-        ref_path = Path(ref)
-        if ref_path.name in filename_to_path:
-            resolved = filename_to_path[ref_path.name]
-            if str(resolved) not in chunk_images:
-                chunk_images.append(str(resolved))
-        # Try to match by full path for absolute references
-        elif ref in pathstr_to_path:
-            resolved = pathstr_to_path[ref]
-            if str(resolved) not in chunk_images:
-                chunk_images.append(str(resolved))
+        resolved = image_index.get(ref)
+        if resolved is not None and resolved not in seen:
+            seen.add(resolved)
+            chunk_images.append(resolved)
 
     return chunk_images
 
 
-def discover_datasheets(folder_path: Path) -> list[Datasheet]:
+def discover_datasheets(
+    folder_path: Path,
+    max_workers: int = DISCOVERY_MAX_WORKERS,
+) -> list[Datasheet]:
     """
     Discover datasheets in folder by scanning for subfolders with .md files.
 
@@ -104,69 +183,108 @@ def discover_datasheets(folder_path: Path) -> list[Datasheet]:
 
     Args:
         folder_path: Path to folder containing datasheet(s)
+        max_workers: Number of subfolders scanned in parallel
 
     Returns:
         List of discovered Datasheet instances
 
     Raises:
-        ValueError: If folder_path is invalid
+        ValueError: If folder_path is invalid or max_workers < 1
         FileNotFoundError: If folder_path does not exist
     """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
     if not folder_path.exists():
         raise FileNotFoundError(f"Folder does not exist: {folder_path}")
 
     if not folder_path.is_dir():
         raise ValueError(f"Path is not a directory: {folder_path}")
 
-    logger.info(f"Discovering datasheets in: {folder_path}")
+    folder_path = folder_path.resolve()
+    logger.info("Discovering datasheets in: %s", folder_path)
+
+    # Single scandir pass: DirEntry caches the file type from the directory
+    # listing, so classifying entries needs no extra stat calls
+    md_files = []
+    subfolders = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subfolders.append(Path(entry.path))
+            elif os.path.normcase(entry.name).endswith(".md"):
+                md_files.append(Path(entry.path))
+
+    # One discovery timestamp for the whole pass
+    discovered_at = datetime.now(UTC)
 
     # Check if this is a single datasheet folder (has .md file directly)
-    md_files = list(folder_path.glob("*.md"))
     if md_files:
         logger.info(
-            f"Detected single datasheet folder with {len(md_files)} .md file(s)"
+            "Detected single datasheet folder with %d .md file(s)", len(md_files)
         )
         try:
             datasheet = Datasheet.from_folder(
                 folder_path,
-                ingestion_timestamp=datetime.now(UTC),
+                ingestion_timestamp=discovered_at,
             )
-            logger.info(f"Discovered single datasheet: {datasheet.name}")
+            logger.info("Discovered single datasheet: %s", datasheet.name)
             return [datasheet]
         except (FileNotFoundError, ValueError) as e:
-            logger.error(f"Failed to create datasheet from folder: {e}")
+            logger.error("Failed to create datasheet from folder: %s", e)
             return []
 
-    # Otherwise, scan subfolders for datasheets
-    datasheets = []
-    subfolders = [p for p in folder_path.iterdir() if p.is_dir()]
+    # Otherwise, scan subfolders for datasheets; listing is I/O-bound, so
+    # folders are scanned concurrently and kept in listing order
+    datasheets = Datasheet.from_folders_parallel(
+        subfolders,
+        max_workers=max_workers,
+        ingestion_timestamp=discovered_at,
+        on_error=_log_skipped_folder,
+    )
+    for datasheet in datasheets:
+        logger.debug("Discovered datasheet: %s", datasheet.name)
 
-    for subfolder in subfolders:
-        try:
-            # Try to create Datasheet from subfolder
-            datasheet = Datasheet.from_folder(
-                subfolder,
-                ingestion_timestamp=datetime.now(UTC),
-            )
-            datasheets.append(datasheet)
-            logger.debug(f"Discovered datasheet: {datasheet.name}")
+    logger.info("Discovered %d datasheets in %s", len(datasheets), folder_path)
 
-        except FileNotFoundError as e:
-            logger.warning(f"Skipping folder '{subfolder.name}': {e}")
-        except ValueError as e:
-            logger.warning(f"Skipping folder '{subfolder.name}': {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error discovering '{subfolder.name}': {e}")
+    return datasheets
 
-    logger.info(f"Discovered {len(datasheets)} datasheets in {folder_path}")
 
-    return datasheets
+def _log_skipped_folder(folder: Path, error: Exception) -> None:
+    """
+    Log a subfolder that discover_datasheets() leaves out.
+
+    Args:
+        folder: Subfolder that is not a valid datasheet folder
+        error: Error raised while loading it
+    """
+    if isinstance(error, (FileNotFoundError, ValueError)):
+        logger.warning("Skipping folder '%s': %s", folder.name, error)
+    else:
+        logger.error("Unexpected error discovering '%s': %s", folder.name, error)
+
+
+def _fingerprint(path: Path) -> str:
+    """
+    Compute a cheap change fingerprint for a file from its stat metadata.
+
+    Uses size and nanosecond mtime only, so no file content is read.
+
+    Args:
+        path: File to fingerprint
+
+    Returns:
+        Fingerprint string in the form "<size>-<mtime_ns>"
+    """
+    st = os.stat(path)
+    return f"{st.st_size}-{st.st_mtime_ns}"
 
 
 def _check_duplicate_datasheet(
     datasheet_name: str,
     chroma_client: ChromaDBClient,
     force_update: bool,
+    fingerprint: str | None = None,
 ) -> tuple[bool, int]:
     """
     Check if datasheet exists and handle force_update logic.
@@ -175,47 +293,89 @@ def _check_duplicate_datasheet(
         datasheet_name: Name of the datasheet
         chroma_client: ChromaDB client
         force_update: Whether to delete existing chunks
+        fingerprint: Current source fingerprint, used to warn when an existing
+            datasheet's markdown changed since it was ingested
 
     Returns:
         Tuple of (should_skip, deleted_count)
     """
-    exists = chroma_client.datasheet_exists(datasheet_name)
-
-    if not force_update and exists:
-        logger.info(f"Datasheet already exists, skipping: {datasheet_name}")
-        return True, 0
-
-    if force_update and exists:
-        logger.info(f"Force update: deleting existing chunks for {datasheet_name}")
+    if force_update:
+        # delete_datasheet() already looks the chunks up, so a separate
+        # existence probe would only add a round-trip
         deleted_count = chroma_client.delete_datasheet(datasheet_name)
-        logger.info(f"Deleted {deleted_count} existing chunks")
+        if deleted_count:
+            logger.info(
+                "Force update: deleted %d existing chunks for %s",
+                deleted_count,
+                datasheet_name,
+            )
         return False, deleted_count
 
+    exists, stored_fingerprint = chroma_client.get_datasheet_fingerprint(datasheet_name)
+    if exists:
+        if fingerprint and stored_fingerprint and stored_fingerprint != fingerprint:
+            logger.warning(
+                "Markdown changed since last ingestion: %s "
+                "(use --force-update to re-ingest)",
+                datasheet_name,
+            )
+        logger.info("Datasheet already exists, skipping: %s", datasheet_name)
+        return True, 0
+
     return False, 0
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_markdown_cached(markdown_path: Path, fingerprint: str) -> str:
+    """
+    Parse a markdown file, memoized per file version.
+
+    The fingerprint is part of the cache key only, so an edited file (new
+    size or mtime) misses the cache and is parsed again.
+
+    Args:
+        markdown_path: Markdown file to parse
+        fingerprint: Stat fingerprint of the file from _fingerprint()
+
+    Returns:
+        Parsed markdown content
+    """
+    logger.debug("Parsing markdown: %s", markdown_path)
+    return parse_markdown_file(markdown_path)
+
+
+def clear_parse_cache() -> None:
+    """Drop all parsed markdown kept by _parse_and_resolve_content()."""
+    _parse_markdown_cached.cache_clear()
+
+
 def _parse_and_resolve_content(
     datasheet: Datasheet,
+    fingerprint: str | None = None,
 ) -> tuple[str, list[Path]]:
     """
     Parse markdown and resolve image paths.
 
+    Re-ingesting an unchanged file in the same process (force updates,
+    evaluation experiments) reuses the earlier parse. Image paths are
+    resolved on every call, since images can be added or removed without
+    touching the markdown file.
+
     Args:
         datasheet: Datasheet to process
+        fingerprint: Stat fingerprint of the markdown file (default: computed
+            here)
 
     Returns:
         Tuple of (content, resolved_images)
     """
-    logger.debug(f"Parsing markdown: {datasheet.markdown_file_path}")
-    content = parse_markdown_file(datasheet.markdown_file_path)
+    if fingerprint is None:
+        fingerprint = _fingerprint(datasheet.markdown_file_path)
 
-    logger.debug(f"Resolving image paths for: {datasheet.name}")
-    content, resolved_images = resolve_all_image_paths(
-        content,
-        datasheet.markdown_file_path,
-    )
+    content = _parse_markdown_cached(datasheet.markdown_file_path, fingerprint)
 
-    return content, resolved_images
+    logger.debug("Resolving image paths for: %s", datasheet.markdown_file_path)
+    return resolve_all_image_paths(content, datasheet.markdown_file_path)
 
 
 def _create_text_chunks(
@@ -239,10 +399,29 @@ def _create_text_chunks(
     return chunker.chunk_markdown(content)
 
 
+def _format_utc_timestamp(timestamp: datetime) -> str:
+    """
+    Format a timestamp as ISO 8601 UTC with microseconds and a "Z" suffix.
+
+    Always yields the same shape, e.g. "2025-01-01T12:00:00.000000Z", whatever
+    the timezone of the input or whether it has a fractional second.
+
+    Args:
+        timestamp: Timestamp to format; naive values are taken as UTC
+
+    Returns:
+        Formatted timestamp string
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
 def _build_content_chunks(
     text_chunks: list[str],
     datasheet: Datasheet,
     resolved_images: list[Path],
+    source_fingerprint: str | None = None,
 ) -> list[ContentChunk]:
     """
     Create ContentChunk instances from text chunks.
@@ -251,32 +430,34 @@ def _build_content_chunks(
         text_chunks: List of text chunks
         datasheet: Source datasheet
         resolved_images: All resolved image paths
+        source_fingerprint: Fingerprint of the source markdown file
 
     Returns:
         List of ContentChunk instances
     """
-    logger.debug(f"Creating {len(text_chunks)} ContentChunk instances")
-    chunks = []
-
-    for idx, text in enumerate(text_chunks):
-        chunk_image_paths = _filter_chunk_image_paths(text, resolved_images)
-
-        chunk = ContentChunk(
-            text=text,
-            datasheet_name=datasheet.name,
-            folder_path=str(datasheet.folder_path),
-            chunk_index=idx,
-            ingestion_timestamp=datasheet.ingestion_timestamp.isoformat() + "Z",
-            image_paths=chunk_image_paths,
-        )
-        chunks.append(chunk)
-
-    return chunks
+    logger.debug("Creating %d ContentChunk instances", len(text_chunks))
+
+    # Format the shared timestamp once
+    ingestion_timestamp = _format_utc_timestamp(datasheet.ingestion_timestamp)
+    image_index = build_image_index(resolved_images)
+    chunk_image_paths = [
+        _filter_chunk_image_paths(text, image_index) for text in text_chunks
+    ]
+
+    return ContentChunk.from_texts(
+        text_chunks,
+        datasheet_name=datasheet.name,
+        folder_path=str(datasheet.folder_path),
+        ingestion_timestamp=ingestion_timestamp,
+        image_paths=chunk_image_paths,
+        source_fingerprint=source_fingerprint,
+    )
 
 
 def _insert_chunks_with_batching(
     chunks: list[ContentChunk],
     chroma_client: ChromaDBClient,
+    insert_concurrency: int = DEFAULT_INSERT_CONCURRENCY,
 ) -> tuple[int, int]:
     """
     Insert chunks into ChromaDB with automatic batching for large datasheets.
@@ -284,67 +465,167 @@ def _insert_chunks_with_batching(
     Args:
         chunks: List of chunks to insert
         chroma_client: ChromaDB client
+        insert_concurrency: Maximum insert batches in flight at once
 
     Returns:
         Tuple of (inserted_chunks, inserted_token_count)
     """
-    total_tokens = sum(chunk.token_count for chunk in chunks)
+    token_counts = [chunk.token_count for chunk in chunks]
+    total_tokens = sum(token_counts)
 
-    if total_tokens > EMBEDDING_MODEL_TOKEN_LIMIT:
+    if (
+        total_tokens > EMBEDDING_MODEL_TOKEN_LIMIT
+        or len(chunks) > MAX_INSERT_BATCH_SIZE
+    ):
         logger.debug(
-            "Large datasheet detected, inserting in batches to avoid API overload"
+            "Large datasheet detected, inserting in batches under the token limit"
+        )
+        return _insert_chunks_in_batches(
+            chunks, chroma_client, token_counts, insert_concurrency
         )
-        return _insert_chunks_in_batches(chunks, chroma_client)
     else:
-        logger.debug(f"Inserting {len(chunks)} chunks into ChromaDB")
+        logger.debug("Inserting %d chunks into ChromaDB", len(chunks))
         inserted_chunks = chroma_client.insert_chunks(chunks)
-        inserted_token_count = sum(chunk.token_count for chunk in chunks)
-        return inserted_chunks, inserted_token_count
+        return inserted_chunks, total_tokens
+
+
+def _split_batch_boundaries(
+    token_counts: list[int],
+    token_limit: int,
+    max_items: int | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Greedily split a run of token counts into batches under a token limit.
+
+    Works on plain integers only, so the caller slices its own sequence with
+    the returned boundaries instead of building batches chunk by chunk. Each
+    batch is filled as far as both limits allow, which yields the fewest
+    batches possible without reordering the items.
+
+    Args:
+        token_counts: Token count of each item, in order
+        token_limit: Maximum tokens per batch (a single larger item still
+            gets its own batch)
+        max_items: Maximum items per batch (default: unlimited)
+
+    Returns:
+        List of (start, end) slice indices of non-empty batches, in order
+    """
+    boundaries = []
+    start = 0
+    batch_tokens = 0
+
+    for index, token_count in enumerate(token_counts):
+        if index > start and (
+            batch_tokens + token_count > token_limit
+            or (max_items is not None and index - start >= max_items)
+        ):
+            boundaries.append((start, index))
+            start = index
+            batch_tokens = 0
+        batch_tokens += token_count
+
+    if start < len(token_counts):
+        boundaries.append((start, len(token_counts)))
+
+    return boundaries
 
 
 def _insert_chunks_in_batches(
     chunks: list[ContentChunk],
     chroma_client: ChromaDBClient,
+    token_counts: list[int] | None = None,
+    insert_concurrency: int = DEFAULT_INSERT_CONCURRENCY,
 ) -> tuple[int, int]:
     """
     Insert chunks in batches to respect embedding model token limits.
 
+    Batches are sent one at a time unless insert_concurrency allows several
+    in flight. If any batch fails, the chunks already inserted
+    for the datasheet are deleted, so a partial datasheet is never left
+    behind to be skipped as already ingested.
+
     Args:
         chunks: List of chunks to insert
         chroma_client: ChromaDB client
+        token_counts: Precomputed token count of each chunk (default: read
+            from the chunks)
+        insert_concurrency: Maximum batches in flight at once (default: 1,
+            one at a time)
 
     Returns:
         Tuple of (inserted_chunks, inserted_token_count)
+
+    Raises:
+        Exception: Whatever the failing batch insertion raised, after the
+            datasheet's inserted chunks were deleted
     """
-    batch = []
-    current_batch_token_count = 0
-    inserted_chunks = 0
-    inserted_token_count = 0
+    if token_counts is None:
+        token_counts = [chunk.token_count for chunk in chunks]
 
-    for chunk in chunks:
-        if (
-            current_batch_token_count + chunk.token_count
-            > EMBEDDING_MODEL_TOKEN_LIMIT
-        ):
-            logger.debug(f"Inserting batch of {len(batch)} chunks into ChromaDB")
-            inserted_chunks += chroma_client.insert_chunks(batch)
-            inserted_token_count += sum(c.token_count for c in batch)
+    batches = [
+        chunks[start:end]
+        for start, end in _split_batch_boundaries(
+            token_counts, EMBEDDING_MODEL_TOKEN_LIMIT, MAX_INSERT_BATCH_SIZE
+        )
+    ]
+    logger.debug(
+        "Inserting %d chunks into ChromaDB in %d batches", len(chunks), len(batches)
+    )
 
-            batch = [chunk]
-            current_batch_token_count = chunk.token_count
+    max_workers = min(insert_concurrency, len(batches))
+    try:
+        if max_workers <= 1:
+            inserted_counts = [chroma_client.insert_chunks(batch) for batch in batches]
         else:
-            batch.append(chunk)
-            current_batch_token_count += chunk.token_count
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="insert"
+            ) as executor:
+                futures = [
+                    executor.submit(chroma_client.insert_chunks, batch)
+                    for batch in batches
+                ]
+                try:
+                    inserted_counts = [future.result() for future in futures]
+                except BaseException:
+                    # Drop batches not yet started and wait for running ones,
+                    # so the cleanup below sees every inserted chunk
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+    except Exception:
+        datasheet_name = chunks[0].datasheet_name
+        logger.error(
+            "Batch insertion failed, removing partially inserted chunks: %s",
+            datasheet_name,
+        )
+        try:
+            chroma_client.delete_datasheet(datasheet_name)
+        except Exception:
+            logger.exception(
+                "Failed to remove partially inserted chunks: %s", datasheet_name
+            )
+        raise
 
-    if batch:
-        logger.debug(f"Inserting final batch of {len(batch)} chunks into ChromaDB")
-        inserted_chunks += chroma_client.insert_chunks(batch)
-        inserted_token_count += sum(c.token_count for c in batch)
+    inserted_chunks = sum(inserted_counts)
+    inserted_token_count = sum(token_counts)
 
-    logger.debug(f"Total inserted tokens: {inserted_token_count}")
+    logger.debug("Total inserted tokens: %d", inserted_token_count)
     return inserted_chunks, inserted_token_count
 
 
+def _elapsed_seconds(start_ns: int) -> float:
+    """
+    Seconds elapsed since a time.perf_counter_ns() reading.
+
+    Args:
+        start_ns: Start reading from time.perf_counter_ns()
+
+    Returns:
+        Elapsed time in seconds (monotonic, unaffected by clock adjustments)
+    """
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
 def _update_datasheet_status(
     datasheet: Datasheet,
     inserted_chunks: int,
@@ -383,13 +664,18 @@ def _log_completion(
     """
     if duration > PERFORMANCE_TARGET_SECONDS:
         logger.warning(
-            f"[!] Ingestion exceeded {PERFORMANCE_TARGET_SECONDS}s target: "
-            f"{datasheet_name} took {duration:.2f}s"
+            "[!] Ingestion exceeded %ss target: %s took %.2fs",
+            PERFORMANCE_TARGET_SECONDS,
+            datasheet_name,
+            duration,
         )
     else:
         logger.info(
-            f"[OK] Ingestion complete: {datasheet_name} "
-            f"{chunk_count} chunks, {token_count} tokens, {duration:.2f}s)"
+            "[OK] Ingestion complete: %s (%d chunks, %d tokens, %.2fs)",
+            datasheet_name,
+            chunk_count,
+            token_count,
+            duration,
         )
 
     logger.info("-" * 70)
@@ -401,6 +687,7 @@ def ingest_datasheet(
     force_update: bool = False,
     chunk_size: int | None = None,
     chunk_overlap: int | None = None,
+    insert_concurrency: int = DEFAULT_INSERT_CONCURRENCY,
 ) -> IngestionResult:
     """
     Ingest single datasheet: parse → chunk → embed → store.
@@ -413,6 +700,8 @@ def ingest_datasheet(
         force_update: If True, delete existing chunks before re-ingestion
         chunk_size: Target chunk size in tokens (default: None, uses chunker default)
         chunk_overlap: Chunk overlap in tokens (default: None, uses chunker default)
+        insert_concurrency: Maximum insert batches of this datasheet in
+            flight at once (default: 1, one at a time)
 
     Returns:
         IngestionResult with status and metrics
@@ -420,18 +709,25 @@ def ingest_datasheet(
     Raises:
         RuntimeError: If ingestion fails critically
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     datasheet.status = IngestionStatus.PROCESSING
 
-    logger.info(f"Starting ingestion: {datasheet.name}")
+    logger.info("Starting ingestion: %s", datasheet.name)
 
     try:
+        try:
+            fingerprint = _fingerprint(datasheet.markdown_file_path)
+        except OSError:
+            # A missing or unreadable markdown file must not turn an already
+            # ingested datasheet into an error: the duplicate check still
+            # works by name, and re-ingestion below reports the problem
+            fingerprint = None
         should_skip, _ = _check_duplicate_datasheet(
-            datasheet.name, chroma_client, force_update
+            datasheet.name, chroma_client, force_update, fingerprint
         )
 
         if should_skip:
-            duration = time.time() - start_time
+            duration = _elapsed_seconds(start_ns)
             logger.info("-" * 70)
             return IngestionResult(
                 datasheet_name=datasheet.name,
@@ -440,19 +736,24 @@ def ingest_datasheet(
                 skipped_reason="Datasheet already exists in ChromaDB (use --force-update to overwrite)",
             )
 
+        if fingerprint is None:
+            fingerprint = _fingerprint(datasheet.markdown_file_path)
+
         # Parse and resolve content
-        content, resolved_images = _parse_and_resolve_content(datasheet)
+        content, resolved_images = _parse_and_resolve_content(datasheet, fingerprint)
 
         # Chunk content
         text_chunks = _create_text_chunks(content, chunk_size, chunk_overlap)
-        chunks = _build_content_chunks(text_chunks, datasheet, resolved_images)
+        chunks = _build_content_chunks(
+            text_chunks, datasheet, resolved_images, fingerprint
+        )
 
         # Insert chunks into ChromaDB with batching if needed
         inserted_chunks, inserted_token_count = _insert_chunks_with_batching(
-            chunks, chroma_client
+            chunks, chroma_client, insert_concurrency
         )
 
-        duration = time.time() - start_time
+        duration = _elapsed_seconds(start_ns)
         _update_datasheet_status(
             datasheet, inserted_chunks, inserted_token_count, duration
         )
@@ -467,13 +768,15 @@ def ingest_datasheet(
         )
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration = _elapsed_seconds(start_ns)
         datasheet.status = IngestionStatus.ERROR
         datasheet.error_message = str(e)
         datasheet.duration_seconds = duration
 
         logger.error(
-            f"[X] Ingestion failed: {datasheet.name} - {e}",
+            "[X] Ingestion failed: %s - %s",
+            datasheet.name,
+            e,
             exc_info=True,
         )
         logger.info("-" * 70)
@@ -486,17 +789,138 @@ def ingest_datasheet(
         )
 
 
+def _ingest_datasheet_safely(
+    datasheet: Datasheet,
+    chroma_client: ChromaDBClient,
+    force_update: bool,
+    chunk_size: int | None,
+    chunk_overlap: int | None,
+    insert_concurrency: int = DEFAULT_INSERT_CONCURRENCY,
+) -> IngestionResult:
+    """
+    Ingest a single datasheet, converting unexpected exceptions to error results.
+
+    Args:
+        datasheet: Datasheet to ingest
+        chroma_client: ChromaDB client for storage
+        force_update: If True, delete existing chunks before re-ingestion
+        chunk_size: Target chunk size in tokens
+        chunk_overlap: Chunk overlap in tokens
+        insert_concurrency: Maximum insert batches in flight at once
+
+    Returns:
+        IngestionResult for the datasheet (never raises)
+    """
+    try:
+        return ingest_datasheet(
+            datasheet,
+            chroma_client,
+            force_update,
+            chunk_size,
+            chunk_overlap,
+            insert_concurrency,
+        )
+    except Exception as e:
+        # Catch unexpected exceptions at batch level
+        logger.error(
+            "  [X] Unexpected error processing %s: %s",
+            datasheet.name,
+            e,
+            exc_info=True,
+        )
+
+        return IngestionResult(
+            datasheet_name=datasheet.name,
+            status=IngestionStatus.ERROR,
+            duration_seconds=0.0,
+            error_message=f"Unexpected error: {e}",
+        )
+
+
+def _log_result_progress(current: int, total: int, result: IngestionResult) -> None:
+    """
+    Default progress callback: log the outcome of one datasheet at DEBUG level.
+
+    Args:
+        current: Number of datasheets completed so far (1-indexed)
+        total: Total number of datasheets in the batch
+        result: Ingestion result of the completed datasheet
+    """
+    if result.is_success():
+        logger.debug(
+            "[%d/%d] %s [OK] Success: %s chunks, %s tokens, %.2fs",
+            current,
+            total,
+            result.datasheet_name,
+            result.chunks_created,
+            result.tokens_inserted,
+            result.duration_seconds,
+        )
+    elif result.is_skipped():
+        logger.debug(
+            "[%d/%d] %s [>>] Skipped: %s",
+            current,
+            total,
+            result.datasheet_name,
+            result.skipped_reason,
+        )
+    elif result.is_error():
+        logger.debug(
+            "[%d/%d] %s [X] Failed: %s",
+            current,
+            total,
+            result.datasheet_name,
+            result.error_message,
+        )
+
+
+def _build_batch_report(
+    results: list[IngestionResult],
+    start_timestamp: datetime,
+) -> BatchIngestionReport:
+    """
+    Create the batch report and log its summary.
+
+    Args:
+        results: Per-datasheet results
+        start_timestamp: Batch start time
+
+    Returns:
+        BatchIngestionReport for the batch
+    """
+    report = BatchIngestionReport(
+        results=results,
+        start_timestamp=start_timestamp,
+        end_timestamp=datetime.now(UTC),
+    )
+
+    logger.info("Batch ingestion complete")
+    logger.info("  Total: %d", report.total_datasheets)
+    logger.info("  [OK] Successful: %d", report.successful)
+    logger.info("  [>>] Skipped: %d", report.skipped)
+    logger.info("  [X] Failed: %d", report.failed)
+    logger.info("  Duration: %.2fs", report.total_duration_seconds)
+
+    return report
+
+
 def ingest_batch(
     datasheets: list[Datasheet],
     chroma_client: ChromaDBClient,
     force_update: bool = False,
     chunk_size: int | None = None,
     chunk_overlap: int | None = None,
+    progress_callback: ProgressCallback | None = None,
+    max_workers: int = 1,
+    insert_concurrency: int = DEFAULT_INSERT_CONCURRENCY,
 ) -> BatchIngestionReport:
     """
-    Ingest batch of datasheets with error handling and progress logging.
+    Ingest batch of datasheets with error handling and progress reporting.
 
     Processes each datasheet independently - one failure doesn't stop the batch.
+    With max_workers > 1, datasheets are ingested on a thread pool so file I/O
+    and ChromaDB/embedding round-trips of different datasheets overlap.
+    Results are always returned in input order.
 
     Args:
         datasheets: List of datasheets to ingest
@@ -504,78 +928,171 @@ def ingest_batch(
         force_update: If True, delete existing chunks before re-ingestion
         chunk_size: Target chunk size in tokens (default: None, uses chunker default)
         chunk_overlap: Chunk overlap in tokens (default: None, uses chunker default)
+        progress_callback: Called as callback(completed, total, result) after
+            each datasheet, in completion order (default: log outcome at DEBUG
+            level)
+        max_workers: Number of datasheets ingested in parallel (default: 1,
+            sequential)
+        insert_concurrency: Maximum insert batches of one datasheet in flight
+            at once (default: 1, one at a time)
 
     Returns:
         BatchIngestionReport with summary and per-datasheet results
 
     Raises:
+        ValueError: If max_workers or insert_concurrency is less than 1
         RuntimeError: If ChromaDB connection fails (batch-level error)
     """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if insert_concurrency < 1:
+        raise ValueError(
+            f"insert_concurrency must be at least 1, got {insert_concurrency}"
+        )
+
+    if progress_callback is None:
+        progress_callback = _log_result_progress
+
     start_timestamp = datetime.now(UTC)
-    logger.info(f"Starting batch ingestion: {len(datasheets)} datasheets")
+    logger.info("Starting batch ingestion: %d datasheets", len(datasheets))
 
     # Validate ChromaDB connection
     is_valid, error_msg = chroma_client.validate_connection()
     if not is_valid:
         raise RuntimeError(f"ChromaDB connection validation failed: {error_msg}")
 
-    results = []
+    total = len(datasheets)
 
-    # Process each datasheet
-    for i, datasheet in enumerate(datasheets, start=1):
-        logger.info(f"[{i}/{len(datasheets)}] Processing: {datasheet.name}")
+    if max_workers == 1:
+        results = []
 
-        try:
-            result = ingest_datasheet(
-                datasheet, chroma_client, force_update, chunk_size, chunk_overlap
+        # Process each datasheet
+        for i, datasheet in enumerate(datasheets, start=1):
+            result = _ingest_datasheet_safely(
+                datasheet,
+                chroma_client,
+                force_update,
+                chunk_size,
+                chunk_overlap,
+                insert_concurrency,
             )
             results.append(result)
+            progress_callback(i, total, result)
+
+        return _build_batch_report(results, start_timestamp)
+
+    logger.info("Ingesting with %d parallel workers", max_workers)
+    results_by_index: dict[int, IngestionResult] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ingest"
+    ) as executor:
+        futures = {
+            executor.submit(
+                _ingest_datasheet_safely,
+                datasheet,
+                chroma_client,
+                force_update,
+                chunk_size,
+                chunk_overlap,
+                insert_concurrency,
+            ): idx
+            for idx, datasheet in enumerate(datasheets)
+        }
+
+        for completed, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results_by_index[futures[future]] = result
+            progress_callback(completed, total, result)
+
+    # Report results in input order, not completion order
+    results = [results_by_index[idx] for idx in range(total)]
+    return _build_batch_report(results, start_timestamp)
+
+
+async def ingest_batch_async(
+    datasheets: list[Datasheet],
+    chroma_client: ChromaDBClient,
+    force_update: bool = False,
+    chunk_size: int | None = None,
+    chunk_overlap: int | None = None,
+    concurrency: int = DEFAULT_INGEST_CONCURRENCY,
+    progress_callback: ProgressCallback | None = None,
+    insert_concurrency: int = DEFAULT_INSERT_CONCURRENCY,
+) -> BatchIngestionReport:
+    """
+    Ingest batch of datasheets concurrently using asyncio.
 
-            # Log progress
-            if result.is_success():
-                logger.info(
-                    f"  [OK] Success: {result.chunks_created} chunks, "
-                    f"{result.tokens_inserted} tokens, "
-                    f"{result.duration_seconds:.2f}s"
-                )
-            elif result.is_skipped():
-                logger.info(f"  [>>] Skipped: {result.skipped_reason}")
-            elif result.is_error():
-                logger.error(f"  [X] Failed: {result.error_message}")
-
-        except Exception as e:
-            # Catch unexpected exceptions at batch level
-            logger.error(
-                f"  [X] Unexpected error processing {datasheet.name}: {e}",
-                exc_info=True,
-            )
+    Each datasheet runs in a worker thread via asyncio.to_thread, so parsing,
+    chunking and ChromaDB round-trips of different datasheets overlap. A
+    semaphore bounds the number of datasheets in flight. Results are returned
+    in the same order as the input datasheets.
 
-            # Create error result
-            result = IngestionResult(
-                datasheet_name=datasheet.name,
-                status=IngestionStatus.ERROR,
-                duration_seconds=0.0,
-                error_message=f"Unexpected error: {e}",
-            )
-            results.append(result)
+    Args:
+        datasheets: List of datasheets to ingest
+        chroma_client: ChromaDB client for storage (shared by all workers)
+        force_update: If True, delete existing chunks before re-ingestion
+        chunk_size: Target chunk size in tokens (default: None, uses chunker default)
+        chunk_overlap: Chunk overlap in tokens (default: None, uses chunker default)
+        concurrency: Maximum number of datasheets ingested at the same time
+        progress_callback: Called as callback(completed, total, result) from the
+            event loop as each datasheet finishes, in completion order
+            (default: log outcome at DEBUG level)
+        insert_concurrency: Maximum insert batches of one datasheet in flight
+            at once (default: 1, one at a time)
 
-    end_timestamp = datetime.now(UTC)
+    Returns:
+        BatchIngestionReport with summary and per-datasheet results
 
-    # Create batch report
-    report = BatchIngestionReport(
-        results=results,
-        start_timestamp=start_timestamp,
-        end_timestamp=end_timestamp,
+    Raises:
+        ValueError: If concurrency or insert_concurrency is less than 1
+        RuntimeError: If ChromaDB connection fails (batch-level error)
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+    if insert_concurrency < 1:
+        raise ValueError(
+            f"insert_concurrency must be at least 1, got {insert_concurrency}"
+        )
+
+    if progress_callback is None:
+        progress_callback = _log_result_progress
+
+    start_timestamp = datetime.now(UTC)
+    logger.info(
+        "Starting async batch ingestion: %d datasheets (concurrency=%d)",
+        len(datasheets),
+        concurrency,
     )
 
-    logger.info("Batch ingestion complete")
-    logger.info(f"  Total: {report.total_datasheets}")
-    logger.info(f"  [OK] Successful: {report.successful}")
-    logger.info(f"  [>>] Skipped: {report.skipped}")
-    logger.info(f"  [X] Failed: {report.failed}")
-    logger.info(f"  Duration: {report.total_duration_seconds:.2f}s")
+    # Validate ChromaDB connection
+    is_valid, error_msg = await asyncio.to_thread(chroma_client.validate_connection)
+    if not is_valid:
+        raise RuntimeError(f"ChromaDB connection validation failed: {error_msg}")
 
-    return report
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(datasheets)
+    completed = 0
+
+    async def _ingest_one(datasheet: Datasheet) -> IngestionResult:
+        nonlocal completed
+        async with semaphore:
+            result = await asyncio.to_thread(
+                _ingest_datasheet_safely,
+                datasheet,
+                chroma_client,
+                force_update,
+                chunk_size,
+                chunk_overlap,
+                insert_concurrency,
+            )
+        completed += 1
+        progress_callback(completed, total, result)
+        return result
+
+    results = await asyncio.gather(*(_ingest_one(d) for d in datasheets))
+
+    return _build_batch_report(list(results), start_timestamp)
 
 
 def track_performance(result: IngestionResult) -> None:
@@ -593,16 +1110,18 @@ def track_performance(result: IngestionResult) -> None:
 
     # Log performance metrics
     logger.info(
-        f"Performance metrics for {result.datasheet_name}: "
-        f"duration={duration:.2f}s, "
-        f"chunks={chunks}, "
-        f"chunks_per_second={chunks / duration if duration > 0 else 0:.2f}"
+        "Performance metrics for %s: duration=%.2fs, chunks=%d, chunks_per_second=%.2f",
+        result.datasheet_name,
+        duration,
+        chunks,
+        chunks / duration if duration > 0 else 0,
     )
 
     # Warn if exceeded target
     if duration > PERFORMANCE_TARGET_SECONDS:
         logger.warning(
-            f"[!] Performance target exceeded: "
-            f"{duration:.2f}s > {PERFORMANCE_TARGET_SECONDS}s target "
-            f"for {result.datasheet_name}"
+            "[!] Performance target exceeded: %.2fs > %ss target for %s",
+            duration,
+            PERFORMANCE_TARGET_SECONDS,
+            result.datasheet_name,
         )
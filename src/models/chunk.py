@@ -6,10 +6,56 @@ Contains:
 """
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+from functools import cache
 
 import tiktoken
 
+# Embedding model whose tokenizer is used for token counts
+EMBEDDING_MODEL_NAME = "text-embedding-3-small"
+
+# Leading Markdown heading markers, e.g. "## " in "## Pinout"
+_HEADING_RE = re.compile(r"^#+\s*")
+
+# Cached values derived from the chunk fields; setting them must not
+# invalidate themselves
+_DERIVED_ATTRS = frozenset({"_detected", "_chromadb_format"})
+
+
+@cache
+def _get_tokenizer() -> tiktoken.Encoding:
+    """Return the embedding model tokenizer, created once per process."""
+    return tiktoken.get_encoding(tiktoken.encoding_name_for_model(EMBEDDING_MODEL_NAME))
+
+
+class _DetectedField:
+    """
+    Dataclass field descriptor for chunk metadata detected from the text.
+
+    Used as the field default (dataclasses support descriptor-typed fields
+    on regular classes), so the field stays an ordinary constructor
+    argument. A value passed in is stored and returned as given; None means
+    "detect", and the value is then taken from the chunk's detection scan,
+    which runs on the first such read and is cached on the chunk.
+    """
+
+    def __init__(self, index: int):
+        self._index = index
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._storage = f"_{name}_value"
+
+    def __get__(self, chunk: "ContentChunk | None", owner: type | None = None):
+        if chunk is None:
+            return None  # Field default: detect from the text
+        value = chunk.__dict__.get(self._storage)
+        if value is None:
+            value = chunk._detected_metadata()[self._index]
+        return value
+
+    def __set__(self, chunk: "ContentChunk", value) -> None:
+        chunk.__dict__[self._storage] = value
+
 
 @dataclass
 class ContentChunk:
@@ -22,11 +68,22 @@ class ContentChunk:
         folder_path: Parent datasheet folder path
         chunk_index: Sequential position within datasheet
         ingestion_timestamp: ISO 8601 timestamp
-        has_table: Flag indicating table presence
-        has_code_block: Flag indicating code block presence
-        section_heading: Markdown section heading (if available)
+        has_table: Flag indicating table presence (detected from text on
+            first read if None)
+        has_code_block: Flag indicating code block presence (detected from
+            text on first read if None)
+        section_heading: Markdown section heading (detected from text on
+            first read if None; pass "" to state the chunk has no heading)
         image_paths: Absolute paths to images referenced in chunk
         source_page_hint: Approximate page number (future)
+        token_count: Number of embedding-model tokens in text (always
+            counted from text; a value passed in is ignored)
+        source_fingerprint: Size/mtime fingerprint of the source markdown file
+
+    Note:
+        Detected values are read like given ones, so dataclasses.replace()
+        copies them; pass has_table=None etc. when replacing the text to
+        have them detected again.
     """
 
     text: str
@@ -34,15 +91,18 @@ class ContentChunk:
     folder_path: str
     chunk_index: int
     ingestion_timestamp: str
-    has_table: bool = False
-    has_code_block: bool = False
-    section_heading: str | None = None
+    has_table: _DetectedField = _DetectedField(0)
+    has_code_block: _DetectedField = _DetectedField(1)
+    section_heading: _DetectedField = _DetectedField(2)
     image_paths: list[str] = field(default_factory=list)
     source_page_hint: int | None = None
     token_count: int = 0
+    source_fingerprint: str | None = None
+    # Token count already computed by from_texts; not meant for other callers
+    _precomputed_token_count: InitVar[int | None] = None
 
-    def __post_init__(self):
-        """Validate chunk attributes and auto-detect metadata."""
+    def __post_init__(self, _precomputed_token_count: int | None):
+        """Validate chunk attributes; metadata detection waits for first read."""
         if not self.text or len(self.text.strip()) == 0:
             raise ValueError("Chunk text cannot be empty")
 
@@ -52,19 +112,136 @@ class ContentChunk:
         if self.chunk_index < 0:
             raise ValueError("Chunk index must be non-negative")
 
-        # Auto-detect table presence
-        self.has_table = self._contains_table()
+        # Derived values, kept as plain attributes rather than dataclass
+        # fields so they stay out of fields(), asdict(), repr() and eq
+        self._detected = None
+        self._chromadb_format = None
+
+        # Always count tokens for the text actually stored, so a count passed
+        # in (or copied by dataclasses.replace) can't go stale; from_texts
+        # hands over its batched counts through the private InitVar
+        if _precomputed_token_count is None:
+            self.token_count = len(_get_tokenizer().encode(self.text))
+        else:
+            self.token_count = _precomputed_token_count
+
+    def __setattr__(self, name: str, value) -> None:
+        """Set an attribute, dropping derived values that depend on it."""
+        super().__setattr__(name, value)
+        if name in _DERIVED_ATTRS:
+            return
+        self.__dict__["_chromadb_format"] = None
+        if name == "text":
+            self.__dict__["_detected"] = None
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        datasheet_name: str,
+        folder_path: str,
+        ingestion_timestamp: str,
+        image_paths: list[list[str]] | None = None,
+        source_fingerprint: str | None = None,
+    ) -> list["ContentChunk"]:
+        """
+        Create chunks for consecutive texts of one datasheet.
+
+        Tokenizes all texts with a single batched tokenizer call instead of
+        one call per chunk, and shares the per-datasheet fields.
+
+        Args:
+            texts: Chunk texts in order (chunk_index is the position)
+            datasheet_name: Parent datasheet identifier
+            folder_path: Parent datasheet folder path
+            ingestion_timestamp: ISO 8601 timestamp
+            image_paths: Per-chunk image paths, parallel to texts
+            source_fingerprint: Fingerprint of the source markdown file
 
-        # Auto-detect code block presence
-        self.has_code_block = self._contains_code_block()
+        Returns:
+            List of ContentChunk instances
 
-        # Extract section heading if not provided
-        if self.section_heading is None:
-            self.section_heading = self._extract_section_heading()
+        Raises:
+            ValueError: If any text is empty
+        """
+        if image_paths is None:
+            image_paths = [[] for _ in texts]
 
-        enc_name = tiktoken.encoding_name_for_model("text-embedding-3-small")
-        tokenizer = tiktoken.get_encoding(enc_name)
-        self.token_count = len(tokenizer.encode(self.text))
+        token_counts = [len(tokens) for tokens in _get_tokenizer().encode_batch(texts)]
+
+        return [
+            cls(
+                text=text,
+                datasheet_name=datasheet_name,
+                folder_path=folder_path,
+                chunk_index=idx,
+                ingestion_timestamp=ingestion_timestamp,
+                image_paths=chunk_image_paths,
+                source_fingerprint=source_fingerprint,
+                _precomputed_token_count=token_count,
+            )
+            for idx, (text, chunk_image_paths, token_count) in enumerate(
+                zip(texts, image_paths, token_counts, strict=True)
+            )
+        ]
+
+    def _detected_metadata(self) -> tuple[bool, bool, str | None]:
+        """
+        Return the detected (has_table, has_code_block, section_heading).
+
+        Scans the text on the first call only; the heading search is skipped
+        when the caller supplied one.
+        """
+        if self._detected is None:
+            find_heading = self.__dict__.get("_section_heading_value") is None
+            self._detected = self._analyze(find_heading)
+        return self._detected
+
+    def _analyze(self, find_heading: bool = True) -> tuple[bool, bool, str | None]:
+        """
+        Detect table, code block and first heading in a single pass.
+
+        A table is at least two lines starting with a pipe (header + one
+        row); a code block is any ``` or ~~~ fence; the heading is the first
+        line starting with "#", without the Markdown syntax.
+
+        Args:
+            find_heading: Whether to look for the heading (default: True)
+
+        Returns:
+            Tuple of (has_table, has_code_block, section_heading)
+        """
+        text = self.text
+
+        # Whole-text substring checks run at C speed and settle the common
+        # prose-only chunk without a per-line loop
+        has_code_block = "```" in text or "~~~" in text
+        find_table = "|" in text
+        find_heading = find_heading and "#" in text
+
+        table_lines = 0
+        section_heading = None
+
+        if not (find_table or find_heading):
+            return False, has_code_block, None
+
+        for line in text.split("\n"):
+            stripped = line.strip()
+
+            if find_table and stripped.startswith("|"):
+                table_lines += 1
+                if table_lines >= 2:
+                    find_table = False
+            elif find_heading and stripped.startswith("#"):
+                # Remove Markdown heading syntax, limit heading length
+                section_heading = _HEADING_RE.sub("", stripped)[:100]
+                find_heading = False
+
+            # Stop once every result is settled; the rest can't change them
+            if not (find_table or find_heading):
+                break
+
+        return table_lines >= 2, has_code_block, section_heading
 
     def _contains_table(self) -> bool:
         """
@@ -73,12 +250,7 @@ class ContentChunk:
         Returns:
             True if markdown table detected
         """
-        # Markdown table pattern: lines with pipes
-        lines = self.text.split("\n")
-        table_lines = [
-            line for line in lines if "|" in line and line.strip().startswith("|")
-        ]
-        return len(table_lines) >= 2  # At least header + one row
+        return self._analyze()[0]
 
     def _contains_code_block(self) -> bool:
         """
@@ -87,7 +259,7 @@ class ContentChunk:
         Returns:
             True if code block detected
         """
-        return "```" in self.text or "~~~" in self.text
+        return self._analyze()[1]
 
     def _extract_section_heading(self) -> str | None:
         """
@@ -96,21 +268,23 @@ class ContentChunk:
         Returns:
             Section heading text (without Markdown syntax), or None
         """
-        lines = self.text.split("\n")
-        for line in lines:
-            if line.strip().startswith("#"):
-                # Remove Markdown heading syntax
-                heading = re.sub(r"^#+\s*", "", line.strip())
-                return heading[:100]  # Limit heading length
-        return None
+        return self._analyze()[2]
 
     def to_chromadb_format(self) -> tuple[str, dict]:
         """
         Convert chunk to ChromaDB format.
 
+        Built once and reused on later calls (e.g. insert retries). Setting
+        a field or changing image_paths in place rebuilds it, and each call
+        returns its own copy of the metadata dict.
+
         Returns:
             Tuple of (document_text, metadata)
         """
+        cached = self._chromadb_format
+        if cached is not None and cached[0] == self.image_paths:
+            return self.text, dict(cached[1])
+
         metadata = {
             "datasheet_name": self.datasheet_name,
             "folder_path": self.folder_path,
@@ -131,4 +305,8 @@ class ContentChunk:
         if self.source_page_hint:
             metadata["source_page_hint"] = self.source_page_hint
 
-        return self.text, metadata
+        if self.source_fingerprint:
+            metadata["source_fingerprint"] = self.source_fingerprint
+
+        self._chromadb_format = (list(self.image_paths), metadata)
+        return self.text, dict(metadata)
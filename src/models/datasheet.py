@@ -8,14 +8,27 @@ Contains:
 """
 
 import os
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import InitVar, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import NamedTuple
 
 from src.models.status import IngestionStatus
 
+# Image file extensions collected for a datasheet (lowercase, with dot)
+_IMAGE_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".svg", ".bmp", ".webp"}
+)
 
-@dataclass
+
+def _is_markdown_name(name: str) -> bool:
+    """Check for a .md file name, case-insensitively where the OS is (Windows)."""
+    return os.path.normcase(name).endswith(".md")
+
+
+@dataclass(slots=True)
 class Datasheet:
     """
     Represents a single electrical component's technical documentation.
@@ -45,12 +58,20 @@ class Datasheet:
     chunk_count: int | None = None
     token_count: int | None = None
     duration_seconds: float | None = None
+    _prevalidated: InitVar[bool] = False
 
-    def __post_init__(self):
+    def __post_init__(self, _prevalidated: bool):
         """Validate datasheet attributes."""
         if not self.name:
             raise ValueError("Datasheet name cannot be empty")
 
+        if self.image_paths is None:
+            self.image_paths = []
+
+        # Paths taken from a directory listing are known to exist
+        if _prevalidated:
+            return
+
         if not self.folder_path.exists():
             raise FileNotFoundError(f"Folder does not exist: {self.folder_path}")
 
@@ -65,8 +86,22 @@ class Datasheet:
         if self.markdown_file_path.suffix.lower() != ".md":
             raise ValueError(f"File is not markdown: {self.markdown_file_path}")
 
-        if self.image_paths is None:
-            self.image_paths = []
+    @classmethod
+    def _from_validated(cls, **fields) -> "Datasheet":
+        """
+        Create Datasheet from paths already checked by a directory listing.
+
+        Skips the filesystem checks in __post_init__ (exists/is_dir/suffix),
+        which would only repeat what the listing proved. Other validation
+        still runs.
+
+        Args:
+            **fields: Datasheet field values
+
+        Returns:
+            Datasheet instance
+        """
+        return cls(**fields, _prevalidated=True)
 
     @classmethod
     def from_folder(
@@ -93,14 +128,103 @@ class Datasheet:
             FileNotFoundError: If no markdown file found
             ValueError: If multiple markdown files found
         """
+        folder_path = folder_path.resolve()
+
+        # Find markdown file (expect exactly one) and all images (optional)
+        md_files, image_paths = cls.scan_folder(folder_path)
+
+        return cls.from_prescanned(
+            folder_path, md_files, image_paths, ingestion_timestamp
+        )
+
+    @classmethod
+    def from_folders_parallel(
+        cls,
+        folders: Iterable[Path],
+        max_workers: int = 16,
+        ingestion_timestamp: datetime | None = None,
+        on_error: Callable[[Path, Exception], None] | None = None,
+    ) -> list["Datasheet"]:
+        """
+        Create Datasheets from many folders concurrently.
+
+        Folder listing is I/O-bound and releases the GIL, so a thread pool
+        overlaps the filesystem latency of each folder, which pays off most
+        on network shares.
+
+        Args:
+            folders: Paths to datasheet folders
+            max_workers: Maximum number of folders scanned at once
+            ingestion_timestamp: When ingestion started (default: now UTC),
+                shared by all datasheets
+            on_error: Called as on_error(folder, error) for a folder that
+                fails, which is then left out of the result (default: the
+                error is raised)
+
+        Returns:
+            Datasheet instances, in the order of folders
+
+        Raises:
+            FileNotFoundError: If a folder has no markdown file (without
+                on_error)
+            ValueError: If a folder has multiple markdown files (without
+                on_error), or max_workers < 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
         if ingestion_timestamp is None:
             ingestion_timestamp = datetime.now(UTC)
 
-        folder_path = folder_path.resolve()
-        name = folder_path.name
+        def load(folder: Path) -> "Datasheet | None":
+            try:
+                return cls.from_folder(folder, ingestion_timestamp)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(folder, e)
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scan"
+        ) as executor:
+            return [
+                datasheet
+                for datasheet in executor.map(load, folders)
+                if datasheet is not None
+            ]
+
+    @classmethod
+    def from_prescanned(
+        cls,
+        folder_path: Path,
+        md_files: list[Path],
+        image_paths: list[Path] | None = None,
+        ingestion_timestamp: datetime | None = None,
+    ) -> "Datasheet":
+        """
+        Create Datasheet from folder contents the caller has already listed.
+
+        Trusts the given markdown and image paths instead of globbing the
+        folder again (see scan_folder), and skips re-checking that they
+        exist.
+
+        Args:
+            folder_path: Absolute path to datasheet folder
+            md_files: Markdown files found directly in the folder
+            image_paths: Image files found in the folder tree
+            ingestion_timestamp: When ingestion started (default: now UTC)
+
+        Returns:
+            Datasheet instance
+
+        Raises:
+            FileNotFoundError: If no markdown file found
+            ValueError: If multiple markdown files found
+        """
+        if ingestion_timestamp is None:
+            ingestion_timestamp = datetime.now(UTC)
 
-        # Find markdown file (expect exactly one)
-        md_files = list(folder_path.glob("*.md"))
         if len(md_files) == 0:
             raise FileNotFoundError(f"No markdown file found in {folder_path}")
         if len(md_files) > 1:
@@ -108,27 +232,69 @@ class Datasheet:
                 f"Multiple markdown files found in {folder_path}: {md_files}"
             )
 
-        markdown_file_path = md_files[0]
-
-        # Find all images (optional)
-        image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".bmp", ".webp"}
-        image_paths = [
-            p
-            for p in folder_path.rglob("*")
-            if p.is_file() and p.suffix.lower() in image_extensions
-        ]
-
-        return cls(
-            name=name,
+        return cls._from_validated(
+            name=folder_path.name,
             folder_path=folder_path,
-            markdown_file_path=markdown_file_path,
+            markdown_file_path=md_files[0],
             ingestion_timestamp=ingestion_timestamp,
             status=IngestionStatus.PENDING,
-            image_paths=image_paths,
+            image_paths=list(image_paths or []),
         )
 
+    @staticmethod
+    def scan_folder(folder_path: Path) -> tuple[list[Path], list[Path]]:
+        """
+        List a datasheet folder's markdown files and images in one walk.
+
+        Uses os.scandir, whose entries carry the file type from the directory
+        listing, so no per-entry stat is needed on Linux/macOS/Windows.
+
+        Args:
+            folder_path: Path to datasheet folder
+
+        Returns:
+            Tuple of (md_files, image_paths)
+            - md_files: .md files directly inside folder_path
+            - image_paths: Image files anywhere in the folder tree
 
-@dataclass
+        Raises:
+            OSError: If the folder itself cannot be listed (unreadable
+                subfolders are skipped)
+        """
+        root = os.fspath(folder_path)
+        md_files = []
+        image_paths = []
+        pending = [root]
+
+        while pending:
+            current = pending.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                # Unreadable subfolders are skipped, as Path.rglob did
+                if current == root:
+                    raise
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        is_file = not is_dir and entry.is_file()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        pending.append(entry.path)
+                    elif not is_file:
+                        continue
+                    elif current == root and _is_markdown_name(entry.name):
+                        md_files.append(Path(entry.path))
+                    elif os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS:
+                        image_paths.append(Path(entry.path))
+
+        return md_files, image_paths
+
+
+@dataclass(slots=True)
 class IngestionResult:
     """
     Represents the outcome of ingesting a single datasheet.
@@ -153,15 +319,15 @@ class IngestionResult:
 
     def is_success(self) -> bool:
         """Check if ingestion was successful."""
-        return self.status == IngestionStatus.SUCCESS
+        return self.status is IngestionStatus.SUCCESS
 
     def is_error(self) -> bool:
         """Check if ingestion failed with error."""
-        return self.status == IngestionStatus.ERROR
+        return self.status is IngestionStatus.ERROR
 
     def is_skipped(self) -> bool:
         """Check if ingestion was skipped."""
-        return self.status == IngestionStatus.SKIPPED
+        return self.status is IngestionStatus.SKIPPED
 
     def exceeded_performance_target(self) -> bool:
         """
@@ -197,7 +363,17 @@ class IngestionResult:
         return result
 
 
-@dataclass
+class _ReportStats(NamedTuple):
+    """Per-status counts and totals of a batch, gathered in one pass."""
+
+    successful: int
+    skipped: int
+    failed: int
+    total_chunks: int
+    slow_names: list[str]
+
+
+@dataclass(slots=True)
 class BatchIngestionReport:
     """
     Represents the summary of a complete ingestion batch.
@@ -211,6 +387,42 @@ class BatchIngestionReport:
     results: list[IngestionResult]
     start_timestamp: datetime
     end_timestamp: datetime
+    _stats_cache: _ReportStats | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def _stats(self) -> _ReportStats:
+        """
+        Aggregate results in a single pass, computed on first access.
+
+        A report is built once the batch has finished, so its results do not
+        change afterwards.
+        """
+        if self._stats_cache is None:
+            success = IngestionStatus.SUCCESS
+            skipped_status = IngestionStatus.SKIPPED
+            error = IngestionStatus.ERROR
+            successful = skipped = failed = total_chunks = 0
+            slow_names = []
+            # Read each result's fields once instead of calling predicates
+            for r in self.results:
+                status = r.status
+                if status is success:
+                    successful += 1
+                    if r.duration_seconds > 30.0:
+                        slow_names.append(r.datasheet_name)
+                elif status is skipped_status:
+                    skipped += 1
+                elif status is error:
+                    failed += 1
+                chunks_created = r.chunks_created
+                if chunks_created:
+                    total_chunks += chunks_created
+            self._stats_cache = _ReportStats(
+                successful, skipped, failed, total_chunks, slow_names
+            )
+        return self._stats_cache
 
     @property
     def total_datasheets(self) -> int:
@@ -220,22 +432,22 @@ class BatchIngestionReport:
     @property
     def successful(self) -> int:
         """Number successfully ingested."""
-        return sum(1 for r in self.results if r.is_success())
+        return self._stats.successful
 
     @property
     def skipped(self) -> int:
         """Number skipped (already exist)."""
-        return sum(1 for r in self.results if r.is_skipped())
+        return self._stats.skipped
 
     @property
     def failed(self) -> int:
         """Number failed with errors."""
-        return sum(1 for r in self.results if r.is_error())
+        return self._stats.failed
 
     @property
     def total_chunks(self) -> int:
         """Total chunks created across all successful ingestions."""
-        return sum(r.chunks_created or 0 for r in self.results if r.chunks_created)
+        return self._stats.total_chunks
 
     @property
     def total_duration_seconds(self) -> float:
@@ -260,11 +472,7 @@ class BatchIngestionReport:
         Returns:
             List of datasheet names
         """
-        return [
-            r.datasheet_name
-            for r in self.results
-            if r.is_success() and r.exceeded_performance_target()
-        ]
+        return list(self._stats.slow_names)
 
     def summary(self) -> str:
         """
@@ -273,11 +481,12 @@ class BatchIngestionReport:
         Returns:
             Formatted summary string
         """
+        rule = "=" * 60
         lines = [
-            os.linesep,
-            "=" * 60,
+            "\n",
+            rule,
             "Ingestion Batch Summary",
-            "=" * 60,
+            rule,
             f"Total Datasheets: {self.total_datasheets}",
             f"  [OK] Successful: {self.successful}",
             f"  [>>] Skipped: {self.skipped}",
@@ -288,19 +497,21 @@ class BatchIngestionReport:
             f"Success Rate: {self.success_rate():.1f}%",
         ]
 
-        slow = self.exceeded_performance_targets()
+        slow = self._stats.slow_names
         if slow:
             lines.append(f"[!] Slow Ingestions (>30s): {len(slow)}")
-            for name in slow[:5]:  # Show first 5
-                lines.append(f"  - {name}")
+            lines.extend(f"  - {name}" for name in slow[:5])  # Show first 5
             if len(slow) > 5:
                 lines.append(f"  ... and {len(slow) - 5} more")
 
         if self.failed > 0:
             lines.append("[X] Failed Datasheets:")
-            for result in self.results:
-                if result.is_error():
-                    lines.append(f"  - {result.datasheet_name}: {result.error_message}")
+            lines.extend(
+                f"  - {result.datasheet_name}: {result.error_message}"
+                for result in self.results
+                if result.status is IngestionStatus.ERROR
+            )
 
-        lines.append("=" * 60)
-        return os.linesep.join(lines)
+        lines.append(rule)
+        # Text-mode streams translate "\n" to the platform line ending
+        return "\n".join(lines)
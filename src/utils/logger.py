@@ -6,13 +6,105 @@ Provides dual-output logging:
 - File: JSON format for machine parsing and analysis
 """
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
+import time
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson is missing
+    orjson = None
+
+# LogRecord attributes that are not user-supplied "extra" fields
+_STANDARD_LOG_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "taskName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+
+
+# Log level per datasheet status; any other status is logged as an error
+_STATUS_LEVELS = {"success": "info", "skipped": "warning"}
+
+# Background listener writing queued records to the real handlers
+_queue_listener: QueueListener | None = None
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue records for the listener thread, keeping exception info."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge message arguments now, leave formatting to the real handlers.
+
+        The stock QueueHandler pre-formats the record and drops exc_info;
+        the queue never leaves this process, so the record can keep it and
+        the JSON/console formatters render exceptions as usual.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            Copy of the record with its message resolved
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def flush_logging() -> None:
+    """
+    Write every record queued so far before returning.
+
+    Call before printing to the console directly, so the output appears
+    after the log lines that precede it instead of interleaved with them.
+    """
+    if _queue_listener is not None:
+        # stop() drains the queue and joins the thread; start() resumes
+        _queue_listener.stop()
+        _queue_listener.start()
+
 
 class JSONFormatter(logging.Formatter):
     """Format log records as JSON for structured logging."""
@@ -28,7 +120,9 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC)
+            .isoformat()
+            .replace("+00:00", "Z"),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -40,31 +134,17 @@ class JSONFormatter(logging.Formatter):
 
         # Add extra fields from record
         for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]:
+            if key not in _STANDARD_LOG_ATTRS:
                 log_data[key] = value
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            except TypeError:
+                # Values orjson rejects but json accepts, e.g. ints over 64 bits
+                pass
         return json.dumps(log_data, default=str)
 
 
@@ -81,6 +161,11 @@ class ConsoleFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    # Colored, padded level names, built once instead of per record
+    LEVEL_PREFIXES = {
+        level: f"{color}{level:8}\033[0m" for level, color in COLORS.items()
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record for console with colors.
@@ -91,24 +176,22 @@ class ConsoleFormatter(logging.Formatter):
         Returns:
             Colored, human-readable log string
         """
-        color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-        reset = self.COLORS["RESET"]
+        prefix = self.LEVEL_PREFIXES.get(record.levelname)
+        if prefix is None:
+            reset = self.COLORS["RESET"]
+            prefix = f"{reset}{record.levelname:8}{reset}"
 
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
 
         # Build log message
-        log_parts = [
-            f"{color}{record.levelname:8}{reset}",
-            f"[{timestamp}]",
-            f"{record.getMessage()}",
-        ]
+        message = f"{prefix} [{timestamp}] {record.getMessage()}"
 
         # Add exception info if present
         if record.exc_info:
-            log_parts.append(f"\n{self.formatException(record.exc_info)}")
+            message += f" \n{self.formatException(record.exc_info)}"
 
-        return " ".join(log_parts)
+        return message
 
 
 def setup_logging(
@@ -119,6 +202,10 @@ def setup_logging(
     """
     Configure structured logging with console and file handlers.
 
+    Handlers run on a background QueueListener thread, so logging calls in
+    the ingestion path only enqueue the record instead of writing to the
+    console and disk. Queued records are flushed at interpreter exit.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to JSON log file (default: .logs/ingestion_{timestamp}.json)
@@ -130,14 +217,16 @@ def setup_logging(
     # Create root logger
     logger = logging.getLogger("datasheet_ingestion")
     logger.setLevel(getattr(logging, log_level.upper()))
+    _stop_queue_listener()  # Flush records queued by a previous setup
     logger.handlers.clear()  # Remove existing handlers
+    handlers: list[logging.Handler] = []
 
     # Console handler (human-readable)
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper()))
         console_handler.setFormatter(ConsoleFormatter())
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler (JSON format)
     if log_file is None:
@@ -152,7 +241,14 @@ def setup_logging(
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
     file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
+
+    # Hand records to the real handlers on a background thread
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Configure third-party loggers to reduce noise
     # ChromaDB: Only show ERROR level
@@ -276,7 +372,5 @@ def log_datasheet_status(
     if error_message:
         metadata["error_message"] = error_message
 
-    level = (
-        "info" if status == "success" else "warning" if status == "skipped" else "error"
-    )
+    level = _STATUS_LEVELS.get(status, "error")
     log_structured(logger, level, f"Datasheet {status}: {datasheet_name}", **metadata)
@@ -4,37 +4,73 @@ Folder structure validators for datasheet ingestion pipeline.
 Validates folder paths, datasheet folder structure, and file permissions.
 """
 
+import codecs
+import json
+import os
 import re
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Windows reserved characters in file/folder names
 WINDOWS_RESERVED_CHARS = r'[<>:"|?*]'
+_RESERVED_CHARS_RE = re.compile(WINDOWS_RESERVED_CHARS)
+
+# Translation table deleting the same characters, for a regex-free search
+_RESERVED_CHARS_TABLE = str.maketrans("", "", '<>:"|?*')
+
+# Whether os.access reflects directory permissions (it ignores ACLs on Windows)
+_ACCESS_CHECKS_PERMISSIONS = os.name != "nt"
 
 # Windows reserved filenames
-WINDOWS_RESERVED_NAMES = {
-    "CON",
-    "PRN",
-    "AUX",
-    "NUL",
-    "COM1",
-    "COM2",
-    "COM3",
-    "COM4",
-    "COM5",
-    "COM6",
-    "COM7",
-    "COM8",
-    "COM9",
-    "LPT1",
-    "LPT2",
-    "LPT3",
-    "LPT4",
-    "LPT5",
-    "LPT6",
-    "LPT7",
-    "LPT8",
-    "LPT9",
-}
+WINDOWS_RESERVED_NAMES = frozenset(
+    {
+        "CON",
+        "PRN",
+        "AUX",
+        "NUL",
+        "COM1",
+        "COM2",
+        "COM3",
+        "COM4",
+        "COM5",
+        "COM6",
+        "COM7",
+        "COM8",
+        "COM9",
+        "LPT1",
+        "LPT2",
+        "LPT3",
+        "LPT4",
+        "LPT5",
+        "LPT6",
+        "LPT7",
+        "LPT8",
+        "LPT9",
+    }
+)
+
+# Longest reserved name, so longer folder names skip the upper() copy
+_MAX_RESERVED_NAME_LEN = max(map(len, WINDOWS_RESERVED_NAMES))
+
+# Accepted image file extensions (lowercase, with dot)
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".svg", ".bmp", ".webp"})
+
+
+# Absolute paths of folders that passed validate_folder_path ->
+# time.monotonic() of the check
+_VALID_FOLDERS: dict[str, float] = {}
+_VALID_FOLDERS_LOCK = threading.Lock()
+VALID_FOLDER_CACHE_TTL_SECONDS = 60.0
+VALID_FOLDER_CACHE_SIZE = 4096
+
+# Image paths recently found missing -> time.monotonic() of the miss
+_MISSING_IMAGES: dict[str, float] = {}
+_MISSING_IMAGES_LOCK = threading.Lock()
+MISSING_IMAGE_CACHE_TTL_SECONDS = 30.0
+MISSING_IMAGE_CACHE_SIZE = 8192
 
 
 class ValidationError(Exception):
@@ -47,6 +83,12 @@ def validate_folder_path(folder_path: Path) -> tuple[bool, str | None]:
     """
     Validate that a folder path exists and is accessible.
 
+    Folders that pass are remembered by absolute path for
+    VALID_FOLDER_CACHE_TTL_SECONDS, since they are not expected to change
+    during a run; failures are always rechecked, so a folder created later
+    validates. Call clear_validation_caches() after removing or changing
+    permissions of a validated folder to recheck it sooner.
+
     Args:
         folder_path: Path to validate
 
@@ -55,33 +97,108 @@ def validate_folder_path(folder_path: Path) -> tuple[bool, str | None]:
         - is_valid: True if validation passed
         - error_message: Error description if validation failed, None otherwise
     """
-    # Check if path exists
-    if not folder_path.exists():
-        return False, f"Path does not exist: {folder_path}"
+    path = os.path.abspath(folder_path)
+    with _VALID_FOLDERS_LOCK:
+        checked_at = _VALID_FOLDERS.get(path)
+        if checked_at is not None:
+            if time.monotonic() - checked_at < VALID_FOLDER_CACHE_TTL_SECONDS:
+                return True, None
+            del _VALID_FOLDERS[path]
+
+    is_valid, error = _check_folder_path(path, Path(folder_path))
+    if is_valid:
+        with _VALID_FOLDERS_LOCK:
+            if len(_VALID_FOLDERS) >= VALID_FOLDER_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _VALID_FOLDERS[next(iter(_VALID_FOLDERS))]
+            _VALID_FOLDERS[path] = time.monotonic()
+    return is_valid, error
+
+
+def _check_folder_path(path: str, folder_path: Path) -> tuple[bool, str | None]:
+    """
+    Run the filesystem checks of validate_folder_path.
 
-    # Check if it's a directory
-    if not folder_path.is_dir():
-        return False, f"Path is not a directory: {folder_path}"
+    Args:
+        path: Absolute path to check
+        folder_path: Path as given by the caller, for error messages
 
-    # Check if it's readable
+    Returns:
+        Tuple of (is_valid, error_message), as for validate_folder_path
+    """
+    # Check that the path exists and is a directory with a single stat
     try:
-        list(folder_path.iterdir())
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        return False, f"Path does not exist: {folder_path}"
     except PermissionError:
         return False, f"Permission denied: cannot read directory {folder_path}"
     except OSError as e:
         return False, f"OS error accessing directory {folder_path}: {e}"
 
-    # Check for Windows reserved characters in path
-    folder_name = folder_path.name
-    if re.search(WINDOWS_RESERVED_CHARS, folder_name):
+    if not stat.S_ISDIR(st.st_mode):
+        return False, f"Path is not a directory: {folder_path}"
+
+    # Check if it's readable. On POSIX a single access() call answers that
+    # without opening the listing; Windows access() ignores ACLs, so there
+    # opening the listing is the only reliable check
+    if _ACCESS_CHECKS_PERMISSIONS:
+        if not os.access(path, os.R_OK | os.X_OK):
+            return False, f"Permission denied: cannot read directory {folder_path}"
+    else:
+        try:
+            with os.scandir(path) as entries:
+                next(entries, None)
+        except PermissionError:
+            return False, f"Permission denied: cannot read directory {folder_path}"
+        except OSError as e:
+            return False, f"OS error accessing directory {folder_path}: {e}"
+
+    name_error = _check_folder_name(os.path.basename(path))
+    if name_error:
+        return False, name_error
+
+    return True, None
+
+
+def clear_validation_caches() -> None:
+    """
+    Forget cached validation results.
+
+    Call after removing, replacing or changing permissions of folders that
+    were already validated in this process, or after adding images that
+    were recently reported missing.
+    """
+    with _VALID_FOLDERS_LOCK:
+        _VALID_FOLDERS.clear()
+    with _MISSING_IMAGES_LOCK:
+        _MISSING_IMAGES.clear()
+
+
+def _check_folder_name(folder_name: str) -> str | None:
+    """
+    Check a folder name against Windows naming restrictions.
+
+    Args:
+        folder_name: Name of folder to check
+
+    Returns:
+        Error description if the name is unusable, None otherwise
+    """
+    # Check for Windows reserved characters in path (deleting them changes
+    # the length only if any are present)
+    if len(folder_name.translate(_RESERVED_CHARS_TABLE)) != len(folder_name):
         # Warning, not error - may work on some systems
-        return True, None  # Still valid, but log warning separately
+        return None  # Still valid, but log warning separately
 
     # Check for Windows reserved names
-    if folder_name.upper() in WINDOWS_RESERVED_NAMES:
-        return False, f"Folder name is Windows reserved: {folder_name}"
+    if (
+        len(folder_name) <= _MAX_RESERVED_NAME_LEN
+        and folder_name.upper() in WINDOWS_RESERVED_NAMES
+    ):
+        return f"Folder name is Windows reserved: {folder_name}"
 
-    return True, None
+    return None
 
 
 def validate_datasheet_folder(
@@ -104,42 +221,60 @@ def validate_datasheet_folder(
     if not is_valid:
         return False, error, None
 
-    # Find all markdown files
+    return _find_markdown_file(folder_path)
+
+
+def _find_markdown_file(
+    folder_path: Path | str,
+) -> tuple[bool, str | None, Path | None]:
+    """
+    Find and probe the single .md file of a folder known to be a directory.
+
+    Args:
+        folder_path: Path to datasheet folder
+
+    Returns:
+        Tuple of (is_valid, error_message, markdown_file_path), as for
+        validate_datasheet_folder
+    """
+    # Find markdown files in one listing; the entry type tells files apart
     try:
-        md_files = list(folder_path.glob("*.md"))
+        with os.scandir(folder_path) as entries:
+            md_entries = [
+                entry
+                for entry in entries
+                if os.path.normcase(entry.name).endswith(".md") and entry.is_file()
+            ]
     except OSError as e:
         return False, f"Error scanning folder {folder_path}: {e}", None
 
     # Check markdown file count
-    if len(md_files) == 0:
+    if len(md_entries) == 0:
         return False, f"No .md file found in folder: {folder_path}", None
 
-    if len(md_files) > 1:
-        file_names = ", ".join(f.name for f in md_files)
+    if len(md_entries) > 1:
+        file_names = ", ".join(entry.name for entry in md_entries)
         return (
             False,
             f"Multiple .md files found in folder {folder_path}: {file_names}",
             None,
         )
 
-    markdown_file = md_files[0]
-
-    # Validate markdown file is readable
-    if not markdown_file.is_file():
-        return False, f"Markdown path is not a file: {markdown_file}", None
+    markdown_path = md_entries[0].path
 
     try:
-        # Try to read the file to check permissions
-        with markdown_file.open("r", encoding="utf-8") as f:
-            f.read(1)  # Read first byte to check readability
+        with open(markdown_path, "rb") as markdown_file:
+            # Decode the buffered start without consuming more; an incremental
+            # decoder accepts a multi-byte character cut off at the buffer end
+            codecs.getincrementaldecoder("utf-8")().decode(markdown_file.peek())
     except PermissionError:
-        return False, f"Permission denied: cannot read file {markdown_file}", None
+        return False, f"Permission denied: cannot read file {markdown_path}", None
     except UnicodeDecodeError:
-        return False, f"File is not valid UTF-8: {markdown_file}", None
+        return False, f"File is not valid UTF-8: {markdown_path}", None
     except OSError as e:
-        return False, f"Error reading file {markdown_file}: {e}", None
+        return False, f"Error reading file {markdown_path}: {e}", None
 
-    return True, None, markdown_file
+    return True, None, Path(markdown_path)
 
 
 def check_special_characters(folder_name: str) -> list[str]:
@@ -155,19 +290,21 @@ def check_special_characters(folder_name: str) -> list[str]:
     warnings = []
 
     # Check for Windows reserved characters
-    if re.search(WINDOWS_RESERVED_CHARS, folder_name):
-        found_chars = re.findall(WINDOWS_RESERVED_CHARS, folder_name)
+    found_chars = {match.group() for match in _RESERVED_CHARS_RE.finditer(folder_name)}
+    if found_chars:
         warnings.append(
-            f"Folder name contains Windows reserved characters: {', '.join(set(found_chars))}"
+            f"Folder name contains Windows reserved characters: {', '.join(found_chars)}"
         )
 
-    # Check for leading/trailing spaces (problematic on Windows)
-    if folder_name != folder_name.strip():
-        warnings.append("Folder name has leading or trailing spaces")
+    if folder_name:
+        # Check for leading/trailing spaces (problematic on Windows); looking
+        # at the end characters avoids building a stripped copy
+        if folder_name[0].isspace() or folder_name[-1].isspace():
+            warnings.append("Folder name has leading or trailing spaces")
 
-    # Check for trailing dots (problematic on Windows)
-    if folder_name.endswith("."):
-        warnings.append("Folder name ends with a dot (.)")
+        # Check for trailing dots (problematic on Windows)
+        if folder_name[-1] == ".":
+            warnings.append("Folder name ends with a dot (.)")
 
     # Check for very long names (Windows MAX_PATH is 260 chars)
     if len(folder_name) > 200:
@@ -180,6 +317,10 @@ def validate_image_path(image_path: Path) -> tuple[bool, str | None]:
     """
     Validate that an image file exists and is accessible.
 
+    Missing paths are remembered for MISSING_IMAGE_CACHE_TTL_SECONDS so
+    documents that reference the same broken image many times don't stat
+    it again each time; clear_validation_caches() forgets them.
+
     Args:
         image_path: Path to image file
 
@@ -188,19 +329,42 @@ def validate_image_path(image_path: Path) -> tuple[bool, str | None]:
         - is_valid: True if validation passed
         - error_message: Error description if validation failed, None otherwise
     """
-    # Check if path exists
-    if not image_path.exists():
+    # Check file extension first: it needs no filesystem access, so
+    # references to non-image assets are rejected without a stat
+    suffix = os.path.splitext(image_path)[1]
+    if suffix.lower() not in IMAGE_EXTENSIONS:
+        return False, f"Invalid image extension: {suffix}"
+
+    # Check if path exists, answering repeat lookups of a recent miss
+    # from the negative cache instead of the filesystem
+    path = os.fspath(image_path)
+    with _MISSING_IMAGES_LOCK:
+        missed_at = _MISSING_IMAGES.get(path)
+        if missed_at is not None:
+            if time.monotonic() - missed_at < MISSING_IMAGE_CACHE_TTL_SECONDS:
+                return False, f"Image file does not exist: {image_path}"
+            del _MISSING_IMAGES[path]
+
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        # Validation runs on discovery/ingestion thread pools, so the
+        # check-then-evict sequence must not interleave with another thread
+        with _MISSING_IMAGES_LOCK:
+            if len(_MISSING_IMAGES) >= MISSING_IMAGE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _MISSING_IMAGES[next(iter(_MISSING_IMAGES))]
+            _MISSING_IMAGES[path] = time.monotonic()
         return False, f"Image file does not exist: {image_path}"
+    except PermissionError:
+        return False, f"Permission denied: cannot read image {image_path}"
+    except OSError as e:
+        return False, f"Error reading image {image_path}: {e}"
 
-    # Check if it's a file
-    if not image_path.is_file():
+    # Check if it's a file (from the same stat)
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Image path is not a file: {image_path}"
 
-    # Check file extension
-    valid_extensions = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".bmp", ".webp"}
-    if image_path.suffix.lower() not in valid_extensions:
-        return False, f"Invalid image extension: {image_path.suffix}"
-
     # Check if readable
     try:
         with image_path.open("rb") as f:
@@ -213,39 +377,224 @@ def validate_image_path(image_path: Path) -> tuple[bool, str | None]:
     return True, None
 
 
-def discover_datasheets(root_folder: Path) -> list[Path]:
+def discover_datasheets(
+    root_folder: Path,
+    max_workers: int = 0,
+    cache_path: Path | None = None,
+) -> list[Path]:
     """
     Discover all datasheet folders in a root directory.
 
     A datasheet folder is defined as a subfolder containing exactly one .md file.
 
+    With cache_path, the result is saved to that JSON file together with the
+    modification times of the root and every datasheet folder. A later call
+    reuses it without rescanning as long as none of those times changed.
+    The cache is opt-in for library callers; the ingestion pipeline and CLI
+    discover datasheets through src.ingestion.pipeline and never pass it.
+
     Args:
         root_folder: Root directory to scan
+        max_workers: Number of subfolders validated in parallel (default: 0,
+            validate serially). Folder order is the same either way.
+        cache_path: Optional JSON file caching the discovery result
 
     Returns:
         List of valid datasheet folder paths
+
+    Raises:
+        ValidationError: If the root folder is invalid or cannot be scanned
+        ValueError: If max_workers is negative
     """
-    datasheet_folders = []
+    if max_workers < 0:
+        raise ValueError(f"max_workers must not be negative, got {max_workers}")
 
     # Validate root folder
     is_valid, error = validate_folder_path(root_folder)
     if not is_valid:
         raise ValidationError(f"Invalid root folder: {error}")
 
-    # Scan for subfolders
+    if cache_path is None:
+        return _scan_datasheet_folders(root_folder, max_workers)
+
+    root = os.fspath(root_folder)
+    try:
+        root_mtime_ns = os.stat(root).st_mtime_ns
+    except OSError as e:
+        raise ValidationError(f"Error scanning {root_folder}: {e}") from e
+
+    datasheet_folders = _load_discovery_cache(cache_path, root, root_mtime_ns)
+    if datasheet_folders is not None:
+        return datasheet_folders
+
+    # Record every candidate's mtime before checking it, so a change made
+    # while the scan runs still invalidates the saved result
+    candidates = _enumerate_candidates(root_folder)
+    mtimes_ns = [_mtime_ns(folder) for folder in candidates]
+    valid_flags = _validate_batch(candidates, max_workers)
+    _write_discovery_cache(
+        cache_path,
+        root,
+        root_mtime_ns,
+        list(zip(candidates, mtimes_ns, valid_flags, strict=True)),
+    )
+
+    return _valid_folders(candidates, valid_flags)
+
+
+def _scan_datasheet_folders(root_folder: Path, max_workers: int) -> list[Path]:
+    """Scan a validated root folder for datasheet folders (see discover_datasheets)."""
+    candidates = _enumerate_candidates(root_folder)
+    return _valid_folders(candidates, _validate_batch(candidates, max_workers))
+
+
+def _valid_folders(candidates: list[str], valid_flags: list[bool]) -> list[Path]:
+    """Return the candidate folders flagged valid, as Path objects."""
+    return [
+        Path(folder)
+        for folder, is_valid in zip(candidates, valid_flags, strict=True)
+        if is_valid
+    ]
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Return a path's modification time in nanoseconds, or None if unknown."""
     try:
-        for subfolder in root_folder.iterdir():
-            if not subfolder.is_dir():
-                continue
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
-            # Check if subfolder is a valid datasheet folder
-            is_valid, error, md_file = validate_datasheet_folder(subfolder)
-            if is_valid:
-                datasheet_folders.append(subfolder)
+
+def _enumerate_candidates(root_folder: Path) -> list[str]:
+    """
+    List the subfolders of a root folder that could be datasheet folders.
+
+    Uses only the root's directory listing: no subfolder is opened or
+    stat'ed here (except symlinks, to see whether they point at a directory).
+
+    Args:
+        root_folder: Validated root directory
+
+    Returns:
+        Subfolder path strings whose names pass the Windows name checks
+
+    Raises:
+        ValidationError: If the root folder cannot be listed
+    """
+    candidates = []
+    try:
+        with os.scandir(root_folder) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                # The listing already shows the subfolder exists and is a
+                # directory, so skip validate_folder_path's probes; a folder
+                # that can't be read fails its markdown scan instead
+                if _check_folder_name(entry.name):
+                    continue
+
+                # Keep the plain path string; Path objects are only built for
+                # the folders that turn out to be valid
+                candidates.append(entry.path)
 
     except PermissionError as e:
         raise ValidationError(f"Permission denied scanning {root_folder}: {e}") from e
     except OSError as e:
         raise ValidationError(f"Error scanning {root_folder}: {e}") from e
 
+    return candidates
+
+
+def _validate_batch(candidates: list[str], max_workers: int) -> list[bool]:
+    """
+    Check which candidate folders hold exactly one readable markdown file.
+
+    Each check touches only its own folder, so with max_workers > 0 they
+    overlap on a thread pool; results keep the candidates' order.
+
+    Args:
+        candidates: Subfolder path strings from _enumerate_candidates
+        max_workers: Number of folders checked in parallel (0: serially)
+
+    Returns:
+        Whether each candidate is a valid datasheet folder, in candidate order
+    """
+    if max_workers == 0 or len(candidates) < 2:
+        results = map(_find_markdown_file, candidates)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(candidates)),
+            thread_name_prefix="discover",
+        ) as executor:
+            results = list(executor.map(_find_markdown_file, candidates))
+
+    return [is_valid for is_valid, _, _ in results]
+
+
+def _load_discovery_cache(
+    cache_path: Path, root: str, root_mtime_ns: int
+) -> list[Path] | None:
+    """
+    Load a discovery result saved by _write_discovery_cache, if still current.
+
+    Args:
+        cache_path: JSON cache file
+        root: Root folder the result must belong to
+        root_mtime_ns: Current modification time of the root folder
+
+    Returns:
+        Cached datasheet folder paths, or None if the cache is missing,
+        unreadable, for another root, or any recorded time has changed
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["root"] != root or cache["root_mtime_ns"] != root_mtime_ns:
+            return None
+
+        # Adding, removing or renaming a markdown file changes its folder's
+        # mtime, so re-checking every candidate folder, valid or not, is
+        # enough to notice that any folder's datasheet status may differ
+        datasheet_folders = []
+        for folder, mtime_ns, is_valid in cache["folders"]:
+            if mtime_ns is None or os.stat(folder).st_mtime_ns != mtime_ns:
+                return None
+            if is_valid:
+                datasheet_folders.append(Path(folder))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
     return datasheet_folders
+
+
+def _write_discovery_cache(
+    cache_path: Path,
+    root: str,
+    root_mtime_ns: int,
+    folders: list[tuple[str, int | None, bool]],
+) -> None:
+    """
+    Save a discovery result, replacing cache_path atomically.
+
+    The cache is an optimization only, so failing to write it is ignored.
+
+    Args:
+        cache_path: JSON cache file
+        root: Root folder that was scanned
+        root_mtime_ns: Modification time of the root folder before the scan
+        folders: (folder, mtime_ns before the scan, is_valid) for every
+            candidate subfolder
+    """
+    tmp_path = f"{os.fspath(cache_path)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"root": root, "root_mtime_ns": root_mtime_ns, "folders": folders}, f
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from src.ingestion.pipeline import clear_parse_cache
+from src.utils.validators import clear_validation_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Start and end every test with empty validation and parse caches."""
+    clear_validation_caches()
+    clear_parse_cache()
+    yield
+    clear_validation_caches()
+    clear_parse_cache()
@@ -0,0 +1,61 @@
+"""
+Tests for BatchIngestionReport aggregation and summary.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from src.models import BatchIngestionReport, IngestionResult, IngestionStatus
+
+
+def _report() -> BatchIngestionReport:
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    return BatchIngestionReport(
+        results=[
+            IngestionResult("LM358", IngestionStatus.SUCCESS, 12.0, chunks_created=4),
+            IngestionResult("TL072", IngestionStatus.SUCCESS, 45.0, chunks_created=6),
+            IngestionResult("NE555", IngestionStatus.SKIPPED, 0.1),
+            IngestionResult(
+                "LM317", IngestionStatus.ERROR, 1.0, error_message="bad table"
+            ),
+        ],
+        start_timestamp=start,
+        end_timestamp=start + timedelta(seconds=60),
+    )
+
+
+def test_report_counts_results_by_status():
+    """Test aggregate counts, chunk total and slow datasheets."""
+    report = _report()
+
+    assert report.total_datasheets == 4
+    assert report.successful == 2
+    assert report.skipped == 1
+    assert report.failed == 1
+    assert report.total_chunks == 10
+    assert report.exceeded_performance_targets() == ["TL072"]
+    assert report.success_rate() == 50.0
+
+
+def test_report_summary_lists_slow_and_failed_datasheets():
+    """Test the summary text includes totals, slow and failed datasheets."""
+    summary = _report().summary()
+
+    assert "Total Datasheets: 4" in summary
+    assert "[!] Slow Ingestions (>30s): 1" in summary
+    assert "  - LM317: bad table" in summary
+
+
+def test_ingestion_status_is_one_class_across_import_paths():
+    """Test every import path yields the same enum, so identity checks hold."""
+    from src.models import datasheet, status
+
+    assert datasheet.IngestionStatus is status.IngestionStatus
+    assert IngestionStatus is status.IngestionStatus
+
+
+def test_report_summary_uses_newlines():
+    """Test the summary uses "\\n" so text-mode output does not double CRs."""
+    summary = _report().summary()
+
+    assert "\r" not in summary
+    assert summary.startswith("\n\n" + "=" * 60)
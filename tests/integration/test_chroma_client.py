@@ -0,0 +1,90 @@
+"""
+Unit tests for ChromaDBClient chunk insertion.
+
+Uses a recording stand-in for the ChromaDB collection and a whitespace
+tokenizer, so no database, embedding API or encoding download is needed.
+"""
+
+import pytest
+
+from src.ingestion.chroma_client import ChromaDBClient
+from src.models import ContentChunk
+from src.models import chunk as chunk_module
+
+
+class WhitespaceTokenizer:
+    """Stand-in tokenizer: one token per whitespace-separated word."""
+
+    def encode(self, text):
+        return text.split()
+
+
+@pytest.fixture(autouse=True)
+def fake_tokenizer(monkeypatch):
+    monkeypatch.setattr(chunk_module, "_get_tokenizer", WhitespaceTokenizer)
+
+
+class RecordingCollection:
+    """Stand-in collection that records the arguments of add()."""
+
+    def __init__(self):
+        self.added = []
+
+    def add(self, **kwargs):
+        self.added.append(kwargs)
+
+
+def _client_with(collection):
+    """Return a ChromaDBClient wired to collection, skipping ChromaDB setup."""
+    client = ChromaDBClient.__new__(ChromaDBClient)
+    client.collection = collection
+    return client
+
+
+def _chunks(count):
+    return [
+        ContentChunk(
+            text=f"chunk {index}",
+            datasheet_name="TL072",
+            folder_path="D:/ds/TL072",
+            chunk_index=index,
+            ingestion_timestamp="2025-01-01T00:00:00Z",
+            has_table=False,
+            has_code_block=False,
+            section_heading="",
+        )
+        for index in range(count)
+    ]
+
+
+def test_insert_chunks_passes_precomputed_embeddings():
+    """Test caller-supplied embeddings reach collection.add unchanged."""
+    collection = RecordingCollection()
+    embeddings = [[0.1, 0.2], [0.3, 0.4]]
+
+    inserted = _client_with(collection).insert_chunks(_chunks(2), embeddings)
+
+    assert inserted == 2
+    [call] = collection.added
+    assert call["embeddings"] is embeddings
+    assert call["ids"] == ["TL072_0", "TL072_1"]
+    assert call["documents"] == ["chunk 0", "chunk 1"]
+
+
+def test_insert_chunks_without_embeddings_leaves_them_to_chromadb():
+    """Test the collection's embedding function is used by default."""
+    collection = RecordingCollection()
+
+    _client_with(collection).insert_chunks(_chunks(1))
+
+    assert collection.added[0]["embeddings"] is None
+
+
+def test_insert_chunks_rejects_mismatched_embeddings():
+    """Test an embedding count that differs from the chunk count is refused."""
+    collection = RecordingCollection()
+
+    with pytest.raises(ValueError, match="1 embeddings for 2 chunks"):
+        _client_with(collection).insert_chunks(_chunks(2), [[0.1, 0.2]])
+
+    assert collection.added == []
@@ -0,0 +1,218 @@
+"""
+Unit tests for the ContentChunk model.
+
+Replaces the tiktoken tokenizer with a whitespace tokenizer so the tests
+do not need to download encoding files.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.models import ContentChunk
+from src.models import chunk as chunk_module
+
+
+class WhitespaceTokenizer:
+    """Stand-in tokenizer: one token per whitespace-separated word."""
+
+    def encode(self, text):
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def fake_tokenizer(monkeypatch):
+    monkeypatch.setattr(chunk_module, "_get_tokenizer", WhitespaceTokenizer)
+
+
+def test_from_texts_assigns_indices_and_token_counts():
+    """Test batch construction numbers chunks and counts tokens."""
+    chunks = ContentChunk.from_texts(
+        ["# Intro\nhello world", "three word text"],
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+        image_paths=[["D:/ds/TL072/a.png"], []],
+    )
+
+    assert [c.chunk_index for c in chunks] == [0, 1]
+    assert [c.token_count for c in chunks] == [4, 3]
+    assert chunks[0].image_paths == ["D:/ds/TL072/a.png"]
+    assert chunks[0].section_heading == "Intro"
+
+
+def test_from_texts_rejects_empty_text():
+    """Test batch construction keeps per-chunk validation."""
+    with pytest.raises(ValueError):
+        ContentChunk.from_texts(
+            ["ok", "   "],
+            datasheet_name="TL072",
+            folder_path="D:/ds/TL072",
+            ingestion_timestamp="2025-01-01T00:00:00Z",
+        )
+
+
+def test_post_init_detects_table_code_block_and_heading():
+    """Test metadata detection from a single scan of the chunk text."""
+    chunk = ContentChunk(
+        text=(
+            "Intro line\n"
+            "## Electrical Characteristics\n"
+            "| Param | Value |\n"
+            "|-------|-------|\n"
+            "```\ncode\n```\n"
+            "# Later heading"
+        ),
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+    )
+
+    assert chunk.has_table is True
+    assert chunk.has_code_block is True
+    assert chunk.section_heading == "Electrical Characteristics"
+
+
+def test_post_init_single_pipe_line_is_not_a_table():
+    """Test a lone pipe-prefixed line is not treated as a table."""
+    chunk = ContentChunk(
+        text="| just one line\nplain text",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+    )
+
+    assert chunk.has_table is False
+    assert chunk.has_code_block is False
+    assert chunk.section_heading is None
+
+
+def test_metadata_is_detected_on_first_read_and_cached():
+    """Test detection waits for the first read, runs once and stays private."""
+    chunk = ContentChunk(
+        text="# Pinout\n| a |\n| b |",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+    )
+
+    assert chunk._detected is None
+    assert chunk.has_table is True
+    detected = chunk._detected
+    assert chunk.section_heading == "Pinout"
+    assert chunk._detected is detected
+    assert set(dataclasses.asdict(chunk)) == {
+        f.name for f in dataclasses.fields(ContentChunk)
+    }
+
+    copied = dataclasses.replace(
+        chunk, text="plain text", has_table=None, section_heading=None
+    )
+
+    assert (copied.has_table, copied.section_heading) == (False, None)
+
+
+def test_to_chromadb_format_tracks_changes_and_returns_copies():
+    """Test conversion hands out copies and follows later field changes."""
+    chunk = ContentChunk(
+        text="pin table",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=3,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+        image_paths=["D:/ds/TL072/a.png", "D:/ds/TL072/b.png"],
+    )
+
+    _, first = chunk.to_chromadb_format()
+    assert first["image_paths"] == "D:/ds/TL072/a.png,D:/ds/TL072/b.png"
+    first["chunk_index"] = 99
+    assert chunk.to_chromadb_format()[1]["chunk_index"] == 3
+
+    chunk.image_paths.append("D:/ds/TL072/c.png")
+    assert chunk.to_chromadb_format()[1]["image_paths"].endswith("c.png")
+
+    chunk.text = "| a | b |\n|---|---|\n| 1 | 2 |"
+    text, metadata = chunk.to_chromadb_format()
+    assert text == chunk.text
+    assert metadata["has_table"] is True
+
+
+def test_caller_supplied_heading_is_kept():
+    """Test a supplied heading wins while table detection still runs."""
+    chunk = ContentChunk(
+        text="# Pinout\n| a |\n| b |",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+        section_heading="",
+    )
+
+    _, metadata = chunk.to_chromadb_format()
+
+    assert metadata["has_table"] is True
+    assert "section_heading" not in metadata
+
+
+def test_explicit_flags_survive_construction():
+    """Test caller-supplied flags are kept even when the text disagrees."""
+    chunk = ContentChunk(
+        text="plain prose without any table",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+        has_table=True,
+    )
+
+    assert chunk.has_table is True
+    assert chunk.to_chromadb_format()[1]["has_table"] is True
+    assert chunk.has_code_block is False
+
+
+def test_caller_supplied_metadata_skips_text_scan(monkeypatch):
+    """Test a chunker that supplies all metadata never triggers the scan."""
+
+    def fail_analyze(self, find_heading=True):
+        raise AssertionError("metadata scan should not run")
+
+    monkeypatch.setattr(ContentChunk, "_analyze", fail_analyze)
+    chunk = ContentChunk(
+        text="# Pinout\n| a |\n| b |",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+        has_table=False,
+        has_code_block=False,
+        section_heading="",
+    )
+
+    _, metadata = chunk.to_chromadb_format()
+
+    assert metadata["has_table"] is False
+    assert metadata["has_code_block"] is False
+    assert "section_heading" not in metadata
+
+
+def test_token_count_follows_the_stored_text():
+    """Test passed-in or copied token counts are recounted from the text."""
+    chunk = ContentChunk(
+        text="hello",
+        datasheet_name="TL072",
+        folder_path="D:/ds/TL072",
+        chunk_index=0,
+        ingestion_timestamp="2025-01-01T00:00:00Z",
+        token_count=99,
+    )
+
+    copied = dataclasses.replace(chunk, text="one two three four five six")
+
+    assert chunk.token_count == 1
+    assert copied.token_count == 6
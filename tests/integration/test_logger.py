@@ -0,0 +1,104 @@
+"""
+Tests for the structured logging formatters.
+"""
+
+import json
+import logging
+import time
+
+from src.utils import logger as logger_module
+from src.utils.logger import (
+    ConsoleFormatter,
+    JSONFormatter,
+    flush_logging,
+    setup_logging,
+)
+
+
+def _record(msg: str, *args, **extra) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "datasheet_ingestion.test", logging.INFO, __file__, 1, msg, args, None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_keeps_only_extra_fields():
+    """Test standard record attributes are dropped and extras kept."""
+    line = JSONFormatter().format(_record("Ingested %s", "TL072", chunks="12"))
+
+    data = json.loads(line)
+
+    assert data["message"] == "Ingested TL072"
+    assert data["level"] == "INFO"
+    assert data["chunks"] == "12"
+    assert "lineno" not in data
+    assert "taskName" not in data
+
+
+def test_json_formatter_accepts_non_string_keys():
+    """Test extras keyed by ints serialize like the stdlib json module does."""
+    line = JSONFormatter().format(
+        _record("Pages", pages={1: "intro", 2: "pinout"}, big={2**70: "x"})
+    )
+
+    data = json.loads(line)
+
+    assert data["pages"] == {"1": "intro", "2": "pinout"}
+    assert data["big"] == {str(2**70): "x"}
+
+
+def test_json_formatter_timestamp_comes_from_record():
+    """Test the timestamp is the record's creation time in UTC."""
+    record = _record("hello")
+    record.created = 1735689600.25  # 2025-01-01T00:00:00.25Z
+
+    data = json.loads(JSONFormatter().format(record))
+
+    assert data["timestamp"] == "2025-01-01T00:00:00.250000Z"
+
+
+def test_setup_logging_writes_queued_records_with_exceptions(tmp_path):
+    """Test records go through the queue listener and keep exception info."""
+    log_file = tmp_path / "ingest.json"
+    logger = setup_logging("DEBUG", log_file=log_file, console_output=False)
+    try:
+        try:
+            raise ValueError("bad table")
+        except ValueError:
+            logger.exception("Failed %s", "TL072")
+    finally:
+        logger_module._stop_queue_listener()
+        logger.handlers.clear()
+
+    lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+
+    assert lines[-1]["message"] == "Failed TL072"
+    assert "ValueError: bad table" in lines[-1]["exception"]
+
+
+def test_flush_logging_writes_queued_records_and_keeps_logging(tmp_path):
+    """Test flushing writes pending records and the listener keeps running."""
+    log_file = tmp_path / "ingest.json"
+    logger = setup_logging("DEBUG", log_file=log_file, console_output=False)
+    try:
+        logger.info("before banner")
+        flush_logging()
+        flushed = log_file.read_text()
+        logger.info("after banner")
+    finally:
+        logger_module._stop_queue_listener()
+        logger.handlers.clear()
+
+    assert "before banner" in flushed
+    assert "after banner" in log_file.read_text()
+
+
+def test_console_formatter_prefixes_level_and_time():
+    """Test console lines carry the colored level and local time."""
+    record = _record("Ingested %s", "TL072")
+    expected_time = time.strftime("%H:%M:%S", time.localtime(record.created))
+
+    line = ConsoleFormatter().format(record)
+
+    assert line == f"\033[32mINFO    \033[0m [{expected_time}] Ingested TL072"
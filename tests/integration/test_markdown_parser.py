@@ -0,0 +1,26 @@
+"""
+Tests for markdown image path resolution.
+"""
+
+from src.ingestion.markdown_parser import resolve_all_image_paths
+
+
+def test_resolve_all_image_paths_rewrites_every_reference(tmp_path):
+    """Test resolved references are rewritten and unresolved ones kept."""
+    (tmp_path / "images").mkdir()
+    pinout = tmp_path / "images" / "pinout.png"
+    pinout.write_bytes(b"")
+    markdown_path = tmp_path / "OPA1.md"
+    content = (
+        "![pins](images/pinout.png)\n"
+        '![again](images/pinout.png "Pinout")\n'
+        "![gone](missing.png)\n"
+    )
+
+    updated, resolved = resolve_all_image_paths(content, markdown_path)
+
+    expected = pinout.resolve()
+    assert resolved == [expected, expected]
+    assert updated == (
+        f'![pins]({expected})\n![again]({expected} "Pinout")\n![gone](missing.png)\n'
+    )
@@ -0,0 +1,330 @@
+"""
+Tests for datasheet discovery and batch ingestion orchestration.
+
+Batch tests use a stub ChromaDB client that reports every datasheet as
+already ingested, so the batch logic can be exercised without embeddings.
+"""
+
+import asyncio
+import ntpath
+import os
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.ingestion import pipeline
+from src.ingestion.pipeline import (
+    _check_duplicate_datasheet,
+    discover_datasheets,
+    ingest_batch,
+    ingest_batch_async,
+)
+from src.models import Datasheet
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "sample_datasheets"
+
+
+class StubChromaClient:
+    """Minimal stand-in for ChromaDBClient where every datasheet exists."""
+
+    def validate_connection(self):
+        return True, None
+
+    def get_datasheet_fingerprint(self, datasheet_name):
+        return True, None
+
+
+def _sample_datasheets() -> list[Datasheet]:
+    return [
+        Datasheet.from_folder(FIXTURES / "LM358"),
+        Datasheet.from_folder(FIXTURES / "TL072"),
+    ]
+
+
+def test_ingest_batch_skips_existing():
+    """Test sequential batch reports skipped datasheets."""
+    report = ingest_batch(_sample_datasheets(), StubChromaClient())
+
+    assert report.total_datasheets == 2
+    assert report.skipped == 2
+
+
+def test_ingest_batch_skips_existing_when_markdown_is_gone(tmp_path):
+    """Test an ingested datasheet whose markdown vanished is still skipped."""
+    folder = tmp_path / "LM358"
+    folder.mkdir()
+    (folder / "LM358.md").write_text("# LM358", encoding="utf-8")
+    datasheet = Datasheet.from_folder(folder)
+    (folder / "LM358.md").unlink()
+
+    report = ingest_batch([datasheet], StubChromaClient())
+
+    assert report.skipped == 1
+
+
+def test_ingest_batch_async_preserves_order():
+    """Test async batch returns results in input order."""
+    datasheets = _sample_datasheets()
+
+    report = asyncio.run(
+        ingest_batch_async(datasheets, StubChromaClient(), concurrency=2)
+    )
+
+    assert [r.datasheet_name for r in report.results] == ["LM358", "TL072"]
+    assert report.skipped == 2
+
+
+def test_ingest_batch_async_rejects_invalid_concurrency():
+    """Test async batch rejects non-positive concurrency."""
+    with pytest.raises(ValueError):
+        asyncio.run(ingest_batch_async([], StubChromaClient(), concurrency=0))
+
+
+def test_ingest_batch_invokes_progress_callback():
+    """Test progress callback receives (completed, total, result) per datasheet."""
+    calls = []
+
+    ingest_batch(
+        _sample_datasheets(),
+        StubChromaClient(),
+        progress_callback=lambda i, n, r: calls.append((i, n, r.datasheet_name)),
+    )
+
+    assert calls == [(1, 2, "LM358"), (2, 2, "TL072")]
+
+
+def test_discover_datasheets_multiple_folders():
+    """Test discovery finds one datasheet per subfolder."""
+    datasheets = discover_datasheets(FIXTURES)
+
+    assert sorted(d.name for d in datasheets) == ["LM358", "TL072"]
+
+
+def test_discover_datasheets_single_folder():
+    """Test discovery treats a folder with a .md file as one datasheet."""
+    datasheets = discover_datasheets(FIXTURES / "TL072")
+
+    assert [d.name for d in datasheets] == ["TL072"]
+
+
+def test_check_duplicate_force_update_skips_existence_probe():
+    """Test force update deletes directly without a separate exists query."""
+
+    class RecordingClient(StubChromaClient):
+        def __init__(self):
+            self.calls = []
+
+        def get_datasheet_fingerprint(self, datasheet_name):
+            self.calls.append("exists")
+            return True, None
+
+        def delete_datasheet(self, datasheet_name):
+            self.calls.append("delete")
+            return 3
+
+    client = RecordingClient()
+
+    assert _check_duplicate_datasheet("TL072", client, force_update=True) == (
+        False,
+        3,
+    )
+    assert client.calls == ["delete"]
+
+
+def test_ingest_batch_parallel_preserves_order():
+    """Test thread-pooled batch returns results in input order."""
+    report = ingest_batch(_sample_datasheets(), StubChromaClient(), max_workers=2)
+
+    assert [r.datasheet_name for r in report.results] == ["LM358", "TL072"]
+    assert report.skipped == 2
+
+
+def test_insert_chunks_in_batches_respects_token_limit(monkeypatch):
+    """Test batches stay under the token limit and all chunks are inserted."""
+    monkeypatch.setattr(pipeline, "EMBEDDING_MODEL_TOKEN_LIMIT", 10)
+    chunks = [SimpleNamespace(token_count=n) for n in (4, 4, 4, 12, 3)]
+    inserted_batches = []
+
+    class InsertClient:
+        def insert_chunks(self, batch):
+            inserted_batches.append([c.token_count for c in batch])
+            return len(batch)
+
+    assert pipeline._insert_chunks_in_batches(chunks, InsertClient()) == (5, 27)
+    assert inserted_batches == [[4, 4], [4], [12], [3]]
+
+
+@pytest.mark.parametrize("insert_concurrency", [1, 3])
+def test_insert_chunks_in_batches_removes_partial_datasheet(
+    monkeypatch, insert_concurrency
+):
+    """Test a failed batch deletes the chunks its sibling batches inserted."""
+    monkeypatch.setattr(pipeline, "EMBEDDING_MODEL_TOKEN_LIMIT", 10)
+    chunks = [SimpleNamespace(datasheet_name="TL072", token_count=n) for n in (8, 8, 8)]
+    deleted = []
+
+    class FailingClient:
+        def insert_chunks(self, batch):
+            if batch[0] is chunks[1]:
+                raise RuntimeError("rate limited")
+            return len(batch)
+
+        def delete_datasheet(self, datasheet_name):
+            deleted.append(datasheet_name)
+            return 1
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        pipeline._insert_chunks_in_batches(
+            chunks, FailingClient(), insert_concurrency=insert_concurrency
+        )
+    assert deleted == ["TL072"]
+
+
+def test_ingest_batch_rejects_invalid_insert_concurrency():
+    """Test insert_concurrency below one is refused before any work starts."""
+    with pytest.raises(ValueError, match="insert_concurrency"):
+        ingest_batch(_sample_datasheets(), StubChromaClient(), insert_concurrency=0)
+
+
+def test_scan_folder_lists_markdown_and_images(tmp_path):
+    """Test one-walk scan finds top-level markdown and nested images."""
+    (tmp_path / "TL072.md").write_text("# TL072", encoding="utf-8")
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "pinout.PNG").write_bytes(b"")
+    (tmp_path / "images" / "notes.md").write_text("nested", encoding="utf-8")
+    (tmp_path / "readme.txt").write_text("ignored", encoding="utf-8")
+
+    md_files, image_paths = Datasheet.scan_folder(tmp_path)
+
+    assert md_files == [tmp_path / "TL072.md"]
+    assert image_paths == [tmp_path / "images" / "pinout.PNG"]
+
+
+def test_scan_folder_matches_markdown_case_insensitively_on_windows(
+    tmp_path, monkeypatch
+):
+    """Test an upper-case .MD extension is found where names ignore case."""
+    (tmp_path / "TL072.MD").write_text("# TL072", encoding="utf-8")
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+
+    md_files, _ = Datasheet.scan_folder(tmp_path)
+
+    assert md_files == [tmp_path / "TL072.MD"]
+
+
+def test_scan_folder_skips_unreadable_subfolders(tmp_path, monkeypatch):
+    """Test a subfolder that cannot be listed is skipped, not fatal."""
+    (tmp_path / "TL072.md").write_text("# TL072", encoding="utf-8")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "pinout.png").write_bytes(b"")
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    md_files, image_paths = Datasheet.scan_folder(tmp_path)
+
+    assert md_files == [tmp_path / "TL072.md"]
+    assert image_paths == [tmp_path / "images" / "pinout.png"]
+
+
+def test_discover_datasheets_skips_folder_with_multiple_markdown(tmp_path):
+    """Test discovery skips subfolders that are not valid datasheets."""
+    good = tmp_path / "good"
+    good.mkdir()
+    (good / "good.md").write_text("# Good", encoding="utf-8")
+    bad = tmp_path / "bad"
+    bad.mkdir()
+    (bad / "a.md").write_text("# A", encoding="utf-8")
+    (bad / "b.md").write_text("# B", encoding="utf-8")
+
+    datasheets = discover_datasheets(tmp_path)
+
+    assert [d.name for d in datasheets] == ["good"]
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        datetime(2025, 1, 1, 12, tzinfo=UTC),
+        datetime(2025, 1, 1, 12),
+        datetime(2025, 1, 1, 13, tzinfo=timezone(timedelta(hours=1))),
+    ],
+)
+def test_format_utc_timestamp_has_a_fixed_shape(timestamp):
+    """Test chunk timestamps are UTC with microseconds and "Z", for any input."""
+    assert pipeline._format_utc_timestamp(timestamp) == "2025-01-01T12:00:00.000000Z"
+
+
+def test_split_batch_boundaries_respects_token_limit():
+    """Test greedy batch boundaries, including an oversized single item."""
+    assert pipeline._split_batch_boundaries([4, 4, 4, 15, 1], 10) == [
+        (0, 2),
+        (2, 3),
+        (3, 4),
+        (4, 5),
+    ]
+    assert pipeline._split_batch_boundaries([], 10) == []
+    assert pipeline._split_batch_boundaries([1] * 5, 10, max_items=2) == [
+        (0, 2),
+        (2, 4),
+        (4, 5),
+    ]
+
+
+def test_parse_and_resolve_content_reparses_only_changed_files(tmp_path):
+    """Test parsed markdown is reused until the file changes on disk."""
+    (tmp_path / "OPA1.md").write_text("# OPA1\n![pin](pin.png)", encoding="utf-8")
+    (tmp_path / "pin.png").write_bytes(b"png")
+    datasheet = Datasheet.from_folder(tmp_path)
+
+    first, images = pipeline._parse_and_resolve_content(datasheet)
+    hits = pipeline._parse_markdown_cached.cache_info().hits
+    assert images == [tmp_path / "pin.png"]
+
+    # Images are resolved again even when the parse is reused
+    (tmp_path / "pin.png").unlink()
+    again, images = pipeline._parse_and_resolve_content(datasheet)
+
+    assert pipeline._parse_markdown_cached.cache_info().hits == hits + 1
+    assert images == []
+    assert "![pin](pin.png)" in again
+
+    datasheet.markdown_file_path.write_text("# OPA1 rev B", encoding="utf-8")
+    changed, _ = pipeline._parse_and_resolve_content(datasheet)
+
+    assert "rev B" in changed
+
+
+def test_from_folders_parallel_preserves_order():
+    """Test concurrent folder scanning returns datasheets in input order."""
+    datasheets = Datasheet.from_folders_parallel(
+        [FIXTURES / "TL072", FIXTURES / "LM358"], max_workers=2
+    )
+
+    assert [d.name for d in datasheets] == ["TL072", "LM358"]
+    assert datasheets[0].ingestion_timestamp == datasheets[1].ingestion_timestamp
+
+
+def test_from_folders_parallel_reports_failed_folders(tmp_path):
+    """Test on_error receives failing folders, which are left out."""
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    failures = []
+
+    datasheets = Datasheet.from_folders_parallel(
+        [FIXTURES / "TL072", empty],
+        on_error=lambda folder, error: failures.append((folder, type(error))),
+    )
+
+    assert [d.name for d in datasheets] == ["TL072"]
+    assert failures == [(empty, FileNotFoundError)]
+    with pytest.raises(FileNotFoundError):
+        Datasheet.from_folders_parallel([empty])
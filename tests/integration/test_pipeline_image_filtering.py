@@ -7,7 +7,7 @@ referenced in a chunk are added to that chunk's image_paths.
 
 from pathlib import Path
 
-from src.ingestion.pipeline import _filter_chunk_image_paths
+from src.ingestion.pipeline import _filter_chunk_image_paths, build_image_index
 
 
 def test_filter_chunk_image_paths_no_images():
@@ -111,3 +111,40 @@ def test_filter_chunk_image_paths_mixed_references():
     assert "image1.png" in result_str
     assert "image2.png" in result_str
     assert "image3.png" not in result_str
+
+
+def test_filter_chunk_image_paths_relative_subdir_reference():
+    """Test relative references with a directory match by filename."""
+    chunk_text = "Image: ![alt](images/image1.png) and ![alt](image1.png)"
+    all_images = [Path("D:/test/images/image1.png")]
+
+    result = _filter_chunk_image_paths(chunk_text, all_images)
+
+    assert result == [str(all_images[0])]
+
+
+def test_filter_chunk_image_paths_accepts_prebuilt_index():
+    """Test a prebuilt image index gives the same result as the path list."""
+    chunk_text = "![a](image2.png) ![b](D:/test/image1.png)"
+    all_images = [Path("D:/test/image1.png"), Path("D:/test/image2.png")]
+
+    image_index = build_image_index(all_images)
+
+    assert _filter_chunk_image_paths(chunk_text, image_index) == [
+        str(all_images[1]),
+        str(all_images[0]),
+    ]
+    assert _filter_chunk_image_paths(chunk_text, image_index) == (
+        _filter_chunk_image_paths(chunk_text, all_images)
+    )
+    assert _filter_chunk_image_paths(chunk_text, build_image_index([])) == []
+
+
+def test_filter_chunk_image_paths_accepts_path_strings():
+    """Test image paths given as strings match like Path objects."""
+    chunk_text = "![a](image1.png) ![b](images/image2.png)"
+    all_images = [str(Path("D:/test/image1.png")), str(Path("D:/test/image2.png"))]
+
+    result = _filter_chunk_image_paths(chunk_text, all_images)
+
+    assert result == all_images
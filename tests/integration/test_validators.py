@@ -0,0 +1,219 @@
+"""
+Tests for folder structure validators.
+"""
+
+import ntpath
+import os
+from pathlib import Path
+
+import pytest
+
+from src.utils import validators
+from src.utils.validators import (
+    ValidationError,
+    check_special_characters,
+    clear_validation_caches,
+    discover_datasheets,
+    validate_datasheet_folder,
+    validate_folder_path,
+    validate_image_path,
+)
+
+
+def _make_datasheet(root: Path, name: str, md_names: tuple[str, ...]) -> Path:
+    folder = root / name
+    folder.mkdir()
+    for md_name in md_names:
+        (folder / md_name).write_text(f"# {name}", encoding="utf-8")
+    return folder
+
+
+def test_discover_datasheets_returns_valid_subfolders(tmp_path):
+    """Test discovery keeps folders with exactly one markdown file."""
+    good = _make_datasheet(tmp_path, "TL072", ("TL072.md",))
+    _make_datasheet(tmp_path, "empty", ())
+    _make_datasheet(tmp_path, "double", ("a.md", "b.md"))
+    (tmp_path / "notes.md").write_text("not a folder", encoding="utf-8")
+
+    assert discover_datasheets(tmp_path) == [good]
+    assert discover_datasheets(tmp_path, max_workers=4) == [good]
+
+
+def test_discover_datasheets_reuses_cache_until_root_changes(tmp_path, monkeypatch):
+    """Test a cached result is reused and rescanned once the root changes."""
+    root = tmp_path / "root"
+    root.mkdir()
+    cache_path = tmp_path / "discovery.json"
+    first = _make_datasheet(root, "LM358", ("LM358.md",))
+
+    assert discover_datasheets(root, cache_path=cache_path) == [first]
+
+    scan = validators._scan_datasheet_folders
+    monkeypatch.setattr(validators, "_scan_datasheet_folders", None)
+    assert discover_datasheets(root, cache_path=cache_path) == [first]
+
+    monkeypatch.setattr(validators, "_scan_datasheet_folders", scan)
+    second = _make_datasheet(root, "TL072", ("TL072.md",))
+    os.utime(root, ns=(0, 0))
+
+    assert sorted(discover_datasheets(root, cache_path=cache_path)) == [
+        first,
+        second,
+    ]
+
+
+def test_discover_datasheets_cache_notices_changed_subfolders(tmp_path):
+    """Test folders that gain or lose validity invalidate the cached result."""
+    root = tmp_path / "root"
+    root.mkdir()
+    cache_path = tmp_path / "discovery.json"
+    valid = _make_datasheet(root, "A", ("A.md",))
+    gains_file = _make_datasheet(root, "B", ())
+    gains_second = _make_datasheet(root, "C", ("C.md",))
+    for folder in (gains_file, gains_second):
+        os.utime(folder, ns=(0, 0))
+
+    assert sorted(discover_datasheets(root, cache_path=cache_path)) == [
+        valid,
+        gains_second,
+    ]
+
+    (gains_file / "B.md").write_text("# B", encoding="utf-8")
+    (gains_second / "extra.md").write_text("# extra", encoding="utf-8")
+
+    assert sorted(discover_datasheets(root, cache_path=cache_path)) == [
+        valid,
+        gains_file,
+    ]
+
+
+def test_validate_folder_path_rejects_missing_and_file_paths(tmp_path):
+    """Test missing paths and files are reported as invalid."""
+    file_path = tmp_path / "file.md"
+    file_path.write_text("x", encoding="utf-8")
+
+    assert validate_folder_path(tmp_path) == (True, None)
+    assert validate_folder_path(tmp_path / "missing")[0] is False
+    assert validate_folder_path(file_path)[0] is False
+    with pytest.raises(ValidationError):
+        discover_datasheets(tmp_path / "missing")
+
+
+def test_validate_datasheet_folder_returns_markdown_path(tmp_path):
+    """Test the single markdown file is found and directories are ignored."""
+    folder = _make_datasheet(tmp_path, "LM358", ("LM358.md",))
+    (folder / "images.md").mkdir()  # A directory, not a markdown file
+
+    is_valid, error, md_file = validate_datasheet_folder(folder)
+
+    assert (is_valid, error, md_file) == (True, None, folder / "LM358.md")
+
+
+def test_validate_datasheet_folder_ignores_extension_case_on_windows(
+    tmp_path, monkeypatch
+):
+    """Test an upper-case .MD file counts where file names ignore case."""
+    folder = _make_datasheet(tmp_path, "TL072", ("TL072.MD",))
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+
+    assert validate_datasheet_folder(folder) == (True, None, folder / "TL072.MD")
+
+
+def test_validate_datasheet_folder_checks_utf8_prefix(tmp_path):
+    """Test invalid UTF-8 is rejected but a character split by the probe is not."""
+    split = _make_datasheet(tmp_path, "split", ())
+    (split / "split.md").write_text("\u20ac" * 5000, encoding="utf-8")
+    bad = _make_datasheet(tmp_path, "bad", ())
+    (bad / "bad.md").write_bytes(b"# bad \xff")
+
+    assert validate_datasheet_folder(split)[:2] == (True, None)
+    assert validate_datasheet_folder(bad) == (
+        False,
+        f"File is not valid UTF-8: {bad / 'bad.md'}",
+        None,
+    )
+
+
+def test_validate_folder_path_caches_only_valid_folders(tmp_path, monkeypatch):
+    """Test failures are rechecked and successes kept until caches clear."""
+    folder = tmp_path / "late"
+
+    assert validate_folder_path(folder)[0] is False
+    folder.mkdir()
+    assert validate_folder_path(folder) == (True, None)
+
+    # Relative paths are cached by their absolute path
+    monkeypatch.chdir(tmp_path)
+    assert validate_folder_path(Path("late")) == (True, None)
+    folder.rmdir()
+    assert validate_folder_path(folder) == (True, None)
+
+    clear_validation_caches()
+
+    assert validate_folder_path(Path("late"))[0] is False
+
+
+def test_validate_folder_path_cache_is_bounded(tmp_path, monkeypatch):
+    """Test cached folders expire after the TTL and the oldest are evicted."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.setattr(validators, "VALID_FOLDER_CACHE_SIZE", 1)
+
+    validate_folder_path(first)
+    validate_folder_path(second)
+
+    assert list(validators._VALID_FOLDERS) == [os.path.abspath(second)]
+
+    monkeypatch.setattr(validators, "VALID_FOLDER_CACHE_TTL_SECONDS", 0.0)
+    second.rmdir()
+
+    assert validate_folder_path(second)[0] is False
+
+
+def test_validate_image_path_remembers_missing_images(tmp_path):
+    """Test a missing image stays reported missing until the cache clears."""
+    image = tmp_path / "pinout.png"
+
+    assert validate_image_path(image)[0] is False
+    image.write_bytes(b"\x89PNG")
+    assert validate_image_path(image)[0] is False
+
+    clear_validation_caches()
+
+    assert validate_image_path(image) == (True, None)
+
+
+def test_validate_image_path_checks_extension_before_filesystem(tmp_path):
+    """Test wrong extensions are rejected first and directories are not files."""
+    (tmp_path / "figure.png").mkdir()
+
+    assert validate_image_path(tmp_path / "missing.pdf") == (
+        False,
+        "Invalid image extension: .pdf",
+    )
+    assert validate_image_path(tmp_path / "figure.png") == (
+        False,
+        f"Image path is not a file: {tmp_path / 'figure.png'}",
+    )
+
+
+def test_folder_name_checks_for_windows_restrictions(tmp_path):
+    """Test reserved characters warn and reserved names are rejected."""
+    reserved = tmp_path / "con"
+    reserved.mkdir()
+
+    assert check_special_characters("TL072") == []
+    assert check_special_characters("") == []
+    assert check_special_characters(" TL072.") == [
+        "Folder name has leading or trailing spaces",
+        "Folder name ends with a dot (.)",
+    ]
+    assert check_special_characters("TL<07>2") == [
+        "Folder name contains Windows reserved characters: " + ", ".join({"<", ">"})
+    ]
+    assert validate_folder_path(reserved) == (
+        False,
+        "Folder name is Windows reserved: con",
+    )